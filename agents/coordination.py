@@ -52,6 +52,14 @@ class CoordinationAgent(BaseAgent):
         # Cache for expensive operations
         self.cache = {}
         self.cache_expiry = {}
+        
+        # Message dispatch table (message type -> handler)
+        self._message_handlers = {
+            "data": self._handle_data,
+            "get_user_status": self._handle_get_user_status,
+            "get_system_status": self._handle_get_system_status,
+            "resolve_alert": self._handle_resolve_alert
+        }
     
     def set_agents(
         self, 
@@ -98,7 +106,7 @@ class CoordinationAgent(BaseAgent):
         Args:
             user_id: ID of the user
         """
-        self.user_contexts[user_id] = {
+        self.user_contexts[user_id] = context = {
             "user_id": user_id,
             "name": f"User {user_id}",  # Default name
             "last_update": datetime.now().isoformat(),
@@ -113,22 +121,22 @@ class CoordinationAgent(BaseAgent):
         }
         
         # Get comprehensive user status from analyzer
-        status = analyzer.get_comprehensive_user_status(user_id)
+        status = await analyzer.get_comprehensive_user_status_async(user_id)
         
         if status:
             # Update context with status data
             if status.get("health"):
-                self.user_contexts[user_id]["health_status"] = status["health"].get("health_status", "unknown")
+                context["health_status"] = status["health"].get("health_status", "unknown")
             
             if status.get("safety"):
-                self.user_contexts[user_id]["safety_status"] = status["safety"].get("safety_status", "unknown")
-                self.user_contexts[user_id]["current_location"] = status["safety"].get("current_location", "unknown")
-                self.user_contexts[user_id]["current_activity"] = status["safety"].get("current_activity", "unknown")
+                context["safety_status"] = status["safety"].get("safety_status", "unknown")
+                context["current_location"] = status["safety"].get("current_location", "unknown")
+                context["current_activity"] = status["safety"].get("current_activity", "unknown")
             
             if status.get("reminders"):
-                self.user_contexts[user_id]["reminder_status"] = status["reminders"].get("reminder_status", "unknown")
+                context["reminder_status"] = status["reminders"].get("reminder_status", "unknown")
             
-            self.user_contexts[user_id]["overall_status"] = status.get("overall_status", "unknown")
+            context["overall_status"] = status.get("overall_status", "unknown")
     
     async def update(self) -> None:
         """
@@ -152,9 +160,9 @@ class CoordinationAgent(BaseAgent):
         self.system_state["active_emergencies"] = active_emergencies
         
         # Update user contexts
-        for user_id in self.user_contexts.keys():
+        for user_id, context in self.user_contexts.items():
             # Check if context update is needed (once per minute)
-            last_update = datetime.fromisoformat(self.user_contexts[user_id].get("last_update", datetime.min.isoformat()))
+            last_update = datetime.fromisoformat(context.get("last_update", datetime.min.isoformat()))
             if (datetime.now() - last_update).total_seconds() > 60:
                 await self._update_user_context(user_id)
     
@@ -165,17 +173,19 @@ class CoordinationAgent(BaseAgent):
         Args:
             user_id: ID of the user
         """
+        context = self.user_contexts[user_id]
+        
         # Update health status
         if self.health_agent:
             try:
                 health_status = await self.health_agent.get_health_status(user_id)
                 if health_status.get("status") == "success":
-                    self.user_contexts[user_id]["health_status"] = health_status["analysis"].get("health_status", "unknown")
+                    context["health_status"] = health_status["analysis"].get("health_status", "unknown")
                     
                     # Add health alerts
                     for alert in health_status.get("alerts", []):
-                        if alert not in self.user_contexts[user_id]["alerts"]:
-                            self.user_contexts[user_id]["alerts"].append(alert)
+                        if alert not in context["alerts"]:
+                            context["alerts"].append(alert)
             except Exception as e:
                 self.logger.error(f"Error updating health status for user {user_id}: {e}")
         
@@ -184,14 +194,14 @@ class CoordinationAgent(BaseAgent):
             try:
                 safety_status = await self.safety_agent.get_safety_status(user_id)
                 if safety_status.get("status") == "success":
-                    self.user_contexts[user_id]["safety_status"] = safety_status["analysis"].get("safety_status", "unknown")
-                    self.user_contexts[user_id]["current_location"] = safety_status["analysis"].get("current_location", "unknown")
-                    self.user_contexts[user_id]["current_activity"] = safety_status["analysis"].get("current_activity", "unknown")
+                    context["safety_status"] = safety_status["analysis"].get("safety_status", "unknown")
+                    context["current_location"] = safety_status["analysis"].get("current_location", "unknown")
+                    context["current_activity"] = safety_status["analysis"].get("current_activity", "unknown")
                     
                     # Add safety alerts
                     for alert in safety_status.get("alerts", []):
-                        if alert not in self.user_contexts[user_id]["alerts"]:
-                            self.user_contexts[user_id]["alerts"].append(alert)
+                        if alert not in context["alerts"]:
+                            context["alerts"].append(alert)
             except Exception as e:
                 self.logger.error(f"Error updating safety status for user {user_id}: {e}")
         
@@ -200,12 +210,12 @@ class CoordinationAgent(BaseAgent):
             try:
                 reminder_status = await self.daily_agent.get_reminder_status(user_id)
                 if reminder_status.get("status") == "success":
-                    self.user_contexts[user_id]["reminder_status"] = reminder_status["analysis"].get("reminder_status", "unknown")
+                    context["reminder_status"] = reminder_status["analysis"].get("reminder_status", "unknown")
                     
                     # Add recommendations
                     for rec in reminder_status.get("recommendations", []):
-                        if rec not in self.user_contexts[user_id]["recommendations"]:
-                            self.user_contexts[user_id]["recommendations"].append(rec)
+                        if rec not in context["recommendations"]:
+                            context["recommendations"].append(rec)
             except Exception as e:
                 self.logger.error(f"Error updating reminder status for user {user_id}: {e}")
         
@@ -215,17 +225,17 @@ class CoordinationAgent(BaseAgent):
                 emergency_status = await self.emergency_agent.get_emergency_status(user_id)
                 if emergency_status.get("status") == "success":
                     if emergency_status.get("active_emergency"):
-                        self.user_contexts[user_id]["emergency_status"] = emergency_status["active_emergency"].get("type", "unknown")
+                        context["emergency_status"] = emergency_status["active_emergency"].get("type", "unknown")
                     else:
-                        self.user_contexts[user_id]["emergency_status"] = "none"
+                        context["emergency_status"] = "none"
             except Exception as e:
                 self.logger.error(f"Error updating emergency status for user {user_id}: {e}")
         
         # Update overall status based on all components
-        self.user_contexts[user_id]["overall_status"] = self._determine_overall_status(user_id)
+        context["overall_status"] = self._determine_overall_status(user_id)
         
         # Update timestamp
-        self.user_contexts[user_id]["last_update"] = datetime.now().isoformat()
+        context["last_update"] = datetime.now().isoformat()
     
     def _determine_overall_status(self, user_id: str) -> str:
         """
@@ -334,14 +344,16 @@ class CoordinationAgent(BaseAgent):
         
         # Update user context
         if result.get("status") == "success":
+            context = self.user_contexts[user_id]
+            
             # Update health status
             if "analysis" in result and "health_status" in result["analysis"]:
-                self.user_contexts[user_id]["health_status"] = result["analysis"]["health_status"]
+                context["health_status"] = result["analysis"]["health_status"]
             
             # Add alerts
             for alert in result.get("alerts", []):
-                if alert not in self.user_contexts[user_id]["alerts"]:
-                    self.user_contexts[user_id]["alerts"].append(alert)
+                if alert not in context["alerts"]:
+                    context["alerts"].append(alert)
             
             # Check for emergencies
             urgent_alerts = [a for a in result.get("alerts", []) if a.get("level") == "urgent"]
@@ -353,12 +365,12 @@ class CoordinationAgent(BaseAgent):
                         "type": "alert",
                         "user_id": user_id,
                         "alert": alert,
-                        "context": self.user_contexts[user_id]
+                        "context": context
                     })
             
             # Update overall status
-            self.user_contexts[user_id]["overall_status"] = self._determine_overall_status(user_id)
-            self.user_contexts[user_id]["last_update"] = datetime.now().isoformat()
+            context["overall_status"] = self._determine_overall_status(user_id)
+            context["last_update"] = datetime.now().isoformat()
         
         return result
     
@@ -390,22 +402,24 @@ class CoordinationAgent(BaseAgent):
         
         # Update user context
         if result.get("status") == "success":
+            context = self.user_contexts[user_id]
+            
             # Update safety status
             if "analysis" in result and "safety_status" in result["analysis"]:
-                self.user_contexts[user_id]["safety_status"] = result["analysis"]["safety_status"]
+                context["safety_status"] = result["analysis"]["safety_status"]
             
             # Update location and activity
             if "analysis" in result:
                 if "current_location" in result["analysis"]:
-                    self.user_contexts[user_id]["current_location"] = result["analysis"]["current_location"]
+                    context["current_location"] = result["analysis"]["current_location"]
                 
                 if "current_activity" in result["analysis"]:
-                    self.user_contexts[user_id]["current_activity"] = result["analysis"]["current_activity"]
+                    context["current_activity"] = result["analysis"]["current_activity"]
             
             # Add alerts
             for alert in result.get("alerts", []):
-                if alert not in self.user_contexts[user_id]["alerts"]:
-                    self.user_contexts[user_id]["alerts"].append(alert)
+                if alert not in context["alerts"]:
+                    context["alerts"].append(alert)
             
             # Check for emergencies
             if result.get("emergency", False) and self.emergency_agent:
@@ -423,8 +437,8 @@ class CoordinationAgent(BaseAgent):
                 })
             
             # Update overall status
-            self.user_contexts[user_id]["overall_status"] = self._determine_overall_status(user_id)
-            self.user_contexts[user_id]["last_update"] = datetime.now().isoformat()
+            context["overall_status"] = self._determine_overall_status(user_id)
+            context["last_update"] = datetime.now().isoformat()
         
         return result
     
@@ -456,18 +470,20 @@ class CoordinationAgent(BaseAgent):
         
         # Update user context
         if result.get("status") == "success":
+            context = self.user_contexts[user_id]
+            
             # Update reminder status
             if "analysis" in result and "reminder_status" in result["analysis"]:
-                self.user_contexts[user_id]["reminder_status"] = result["analysis"]["reminder_status"]
+                context["reminder_status"] = result["analysis"]["reminder_status"]
             
             # Add recommendations
             for rec in result.get("recommendations", []):
-                if rec not in self.user_contexts[user_id]["recommendations"]:
-                    self.user_contexts[user_id]["recommendations"].append(rec)
+                if rec not in context["recommendations"]:
+                    context["recommendations"].append(rec)
             
             # Update overall status
-            self.user_contexts[user_id]["overall_status"] = self._determine_overall_status(user_id)
-            self.user_contexts[user_id]["last_update"] = datetime.now().isoformat()
+            context["overall_status"] = self._determine_overall_status(user_id)
+            context["last_update"] = datetime.now().isoformat()
         
         return result
     
@@ -613,11 +629,12 @@ class CoordinationAgent(BaseAgent):
         Please provide a 2-3 sentence summary of the user's current status, highlighting the most important information and any areas requiring attention.
         """
         
-        # Generate response
+        # Generate response (deterministic, so repeated requests for an unchanged
+        # status are served from the client's response cache)
         return await self.generate_llm_response(
             prompt,
             max_tokens=200,
-            temperature=0.7,
+            temperature=0,
             response_type="status_summary"
         )
     
@@ -644,12 +661,14 @@ class CoordinationAgent(BaseAgent):
                 "message": f"User {user_id} not found"
             }
         
+        context = self.user_contexts[user_id]
+        
         # Find the alert
         found = False
-        for i, alert in enumerate(self.user_contexts[user_id].get("alerts", [])):
+        for i, alert in enumerate(context.get("alerts", [])):
             if alert.get("id") == alert_id:
                 # Remove from alerts list
-                self.user_contexts[user_id]["alerts"].pop(i)
+                context["alerts"].pop(i)
                 found = True
                 break
         
@@ -673,8 +692,8 @@ class CoordinationAgent(BaseAgent):
         self.logger.info(f"Resolved alert {alert_id} for user {user_id}")
         
         # Update overall status
-        self.user_contexts[user_id]["overall_status"] = self._determine_overall_status(user_id)
-        self.user_contexts[user_id]["last_update"] = datetime.now().isoformat()
+        context["overall_status"] = self._determine_overall_status(user_id)
+        context["last_update"] = datetime.now().isoformat()
         
         return {
             "status": "success",
@@ -742,38 +761,77 @@ class CoordinationAgent(BaseAgent):
         """
         message_type = message.get("type", "unknown")
         
-        if message_type == "data":
-            return await self.handle_incoming_data(message.get("data", {}))
+        handler = self._message_handlers.get(message_type)
+        if handler is None:
+            return {
+                "status": "error",
+                "message": f"Unknown message type: {message_type}"
+            }
+        
+        return await handler(message)
+    
+    async def _handle_data(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "data" message.
         
-        elif message_type == "get_user_status":
-            user_id = message.get("user_id")
+        Args:
+            message: Message to process
             
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in get_user_status request"
-                }
+        Returns:
+            Response to the message
+        """
+        return await self.handle_incoming_data(message.get("data", {}))
+    
+    async def _handle_get_user_status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "get_user_status" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.get_user_status(user_id)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in get_user_status request"
+            }
         
-        elif message_type == "get_system_status":
-            return await self.get_system_status()
+        return await self.get_user_status(user_id)
+    
+    async def _handle_get_system_status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "get_system_status" message.
         
-        elif message_type == "resolve_alert":
-            user_id = message.get("user_id")
-            alert_id = message.get("alert_id")
-            resolution_details = message.get("resolution_details")
+        Args:
+            message: Message to process
             
-            if not user_id or not alert_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id or alert_id in resolve_alert request"
-                }
+        Returns:
+            Response to the message
+        """
+        return await self.get_system_status()
+    
+    async def _handle_resolve_alert(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "resolve_alert" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.resolve_alert(user_id, alert_id, resolution_details)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        alert_id = message.get("alert_id")
+        resolution_details = message.get("resolution_details")
         
-        else:
+        if not user_id or not alert_id:
             return {
                 "status": "error",
-                "message": f"Unknown message type: {message_type}"
+                "message": "Missing user_id or alert_id in resolve_alert request"
             }
+        
+        return await self.resolve_alert(user_id, alert_id, resolution_details)
@@ -5,6 +5,9 @@ Manages reminders and daily activities for elderly users.
 
 import asyncio
 import json
+import hashlib
+from collections import OrderedDict, deque
+from itertools import islice
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import random
@@ -20,6 +23,37 @@ class DailyAssistantAgent(BaseAgent):
     Agent responsible for managing reminders and daily activities.
     """
     
+    # Maximum number of cached LLM reminder analyses
+    LLM_CACHE_SIZE = 256
+    
+    # Reminder content options by (lowercase) reminder type
+    REMINDER_CONTENT = {
+        "medication": (
+            "Take your blood pressure medication",
+            "Time for your heart medication",
+            "Don't forget your daily vitamin",
+            "Take your arthritis medication"
+        ),
+        "hydration": (
+            "Drink a glass of water",
+            "Stay hydrated - have some water",
+            "Time to have some water",
+            "Remember to drink fluids regularly"
+        ),
+        "exercise": (
+            "Time for your gentle stretching routine",
+            "Do your daily walking exercise",
+            "Remember to do your physical therapy exercises",
+            "Time for some light movement activities"
+        ),
+        "appointment": (
+            "Doctor's appointment tomorrow at 10:00 AM",
+            "Reminder: Physical therapy session at 2:00 PM",
+            "You have a telehealth call scheduled",
+            "Don't forget your check-up appointment"
+        )
+    }
+    
     def __init__(self, config: Config):
         """
         Initialize the Daily Assistant Agent.
@@ -38,6 +72,20 @@ class DailyAssistantAgent(BaseAgent):
         # Cache for reminder analyses
         self.reminder_analyses = {}
         self.analysis_timestamps = {}
+        
+        # LRU cache of LLM analyses keyed on a hash of the analysis inputs
+        self._llm_analysis_cache = OrderedDict()
+        
+        # Dedicated random generator for picking reminder content
+        self._rng = random.Random()
+        
+        # Message dispatch table (message type -> handler)
+        self._message_handlers = {
+            "reminder_data": self._handle_reminder_data,
+            "get_status": self._handle_get_status,
+            "update_preferences": self._handle_update_preferences,
+            "add_reminder": self._handle_add_reminder
+        }
     
     async def initialize(self) -> None:
         """
@@ -62,7 +110,7 @@ class DailyAssistantAgent(BaseAgent):
         self.user_data[user_id] = {
             "reminder_history": [],
             "upcoming_reminders": [],
-            "alert_history": [],
+            "alert_history": deque(maxlen=20),  # Keep only recent alerts (last 20)
             "reminder_preferences": self._get_default_reminder_preferences(),
             "last_reminder": None,
             "last_reminder_time": None
@@ -177,36 +225,12 @@ class DailyAssistantAgent(BaseAgent):
         Returns:
             Reminder content string
         """
-        if reminder_type.lower() == "medication":
-            return random.choice([
-                "Take your blood pressure medication",
-                "Time for your heart medication",
-                "Don't forget your daily vitamin",
-                "Take your arthritis medication"
-            ])
-        elif reminder_type.lower() == "hydration":
-            return random.choice([
-                "Drink a glass of water",
-                "Stay hydrated - have some water",
-                "Time to have some water",
-                "Remember to drink fluids regularly"
-            ])
-        elif reminder_type.lower() == "exercise":
-            return random.choice([
-                "Time for your gentle stretching routine",
-                "Do your daily walking exercise",
-                "Remember to do your physical therapy exercises",
-                "Time for some light movement activities"
-            ])
-        elif reminder_type.lower() == "appointment":
-            return random.choice([
-                "Doctor's appointment tomorrow at 10:00 AM",
-                "Reminder: Physical therapy session at 2:00 PM",
-                "You have a telehealth call scheduled",
-                "Don't forget your check-up appointment"
-            ])
-        else:
+        options = self.REMINDER_CONTENT.get(reminder_type.lower())
+        
+        if options is None:
             return f"Reminder for your {reminder_type}"
+        
+        return options[self._rng.randrange(len(options))]
     
     async def update(self) -> None:
         """
@@ -278,9 +302,6 @@ class DailyAssistantAgent(BaseAgent):
             if overdue_alerts:
                 user_data["alert_history"].extend(overdue_alerts)
                 
-                # Keep only recent alerts (last 20)
-                user_data["alert_history"] = user_data["alert_history"][-20:]
-                
                 # Report alerts to coordination agent
                 await self._report_alerts(user_id, overdue_alerts)
     
@@ -669,9 +690,24 @@ class DailyAssistantAgent(BaseAgent):
         if analysis.get("status") != "success":
             return ""
         
-        # Create a detailed prompt for the LLM
         ack_rate = analysis.get("acknowledgment_rate", 0)
         reminder_counts = analysis.get("reminder_counts", {})
+        
+        # Reuse a previous analysis when the inputs are effectively unchanged
+        # (acknowledgment rate is bucketed to whole percent)
+        cache_key = hashlib.sha256(json.dumps({
+            "user_id": user_id,
+            "ack_rate": round(ack_rate),
+            "reminder_counts": reminder_counts,
+            "recommendations": [rec["message"] for rec in recommendations]
+        }, sort_keys=True, default=str).encode()).hexdigest()
+        
+        cached = self._llm_analysis_cache.get(cache_key)
+        if cached is not None:
+            self._llm_analysis_cache.move_to_end(cache_key)
+            return cached
+        
+        # Create a detailed prompt for the LLM
         recommendation_text = "\n".join([f"- {rec['message']}" for rec in recommendations])
         
         prompt = f"""
@@ -690,12 +726,20 @@ class DailyAssistantAgent(BaseAgent):
         """
         
         # Generate response
-        return await self.generate_llm_response(
+        response = await self.generate_llm_response(
             prompt,
             max_tokens=200,
             temperature=0.7,
             response_type="reminder_analysis"
         )
+        
+        # Store in cache (but not failed generations), evicting the least recently used entry
+        if not response.startswith("Error generating response"):
+            self._llm_analysis_cache[cache_key] = response
+            if len(self._llm_analysis_cache) > self.LLM_CACHE_SIZE:
+                self._llm_analysis_cache.popitem(last=False)
+        
+        return response
     
     async def get_reminder_status(self, user_id: str) -> Dict[str, Any]:
         """
@@ -730,7 +774,8 @@ class DailyAssistantAgent(BaseAgent):
         # Get recent alerts
         recent_alerts = []
         if user_id in self.user_data and "alert_history" in self.user_data[user_id]:
-            recent_alerts = self.user_data[user_id]["alert_history"][-5:]  # Last 5 alerts
+            alert_history = self.user_data[user_id]["alert_history"]
+            recent_alerts = list(islice(alert_history, max(0, len(alert_history) - 5), None))  # Last 5 alerts
         
         # Generate recommendations
         recommendations = self._generate_recommendations(user_id, analysis)
@@ -888,47 +933,86 @@ class DailyAssistantAgent(BaseAgent):
         """
         message_type = message.get("type", "unknown")
         
-        if message_type == "reminder_data":
-            return await self.process_reminder_data(message.get("data", {}))
+        handler = self._message_handlers.get(message_type)
+        if handler is None:
+            return {
+                "status": "error",
+                "message": f"Unknown message type: {message_type}"
+            }
         
-        elif message_type == "get_status":
-            user_id = message.get("user_id")
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in get_status request"
-                }
-            
-            return await self.get_reminder_status(user_id)
+        return await handler(message)
+    
+    async def _handle_reminder_data(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "reminder_data" message.
         
-        elif message_type == "update_preferences":
-            user_id = message.get("user_id")
-            preferences = message.get("preferences", {})
+        Args:
+            message: Message to process
             
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in update_preferences request"
-                }
+        Returns:
+            Response to the message
+        """
+        return await self.process_reminder_data(message.get("data", {}))
+    
+    async def _handle_get_status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "get_status" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.update_reminder_preferences(user_id, preferences)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in get_status request"
+            }
         
-        elif message_type == "add_reminder":
-            user_id = message.get("user_id")
-            reminder_type = message.get("reminder_type")
-            content = message.get("content")
-            scheduled_time = message.get("scheduled_time")
+        return await self.get_reminder_status(user_id)
+    
+    async def _handle_update_preferences(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "update_preferences" message.
+        
+        Args:
+            message: Message to process
             
-            if not user_id or not reminder_type or not content or not scheduled_time:
-                return {
-                    "status": "error",
-                    "message": "Missing parameters in add_reminder request"
-                }
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        preferences = message.get("preferences", {})
+        
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in update_preferences request"
+            }
+        
+        return await self.update_reminder_preferences(user_id, preferences)
+    
+    async def _handle_add_reminder(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "add_reminder" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.add_reminder(user_id, reminder_type, content, scheduled_time)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        reminder_type = message.get("reminder_type")
+        content = message.get("content")
+        scheduled_time = message.get("scheduled_time")
         
-        else:
+        if not user_id or not reminder_type or not content or not scheduled_time:
             return {
                 "status": "error",
-                "message": f"Unknown message type: {message_type}"
+                "message": "Missing parameters in add_reminder request"
             }
+        
+        return await self.add_reminder(user_id, reminder_type, content, scheduled_time)
@@ -5,6 +5,7 @@ Handles emergency situations and coordinates appropriate responses.
 
 import asyncio
 import json
+import re
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import random
@@ -20,6 +21,9 @@ class EmergencyResponseAgent(BaseAgent):
     Agent responsible for handling emergency situations and coordinating responses.
     """
     
+    # Terms that classify an alert type as a fall or health emergency
+    ALERT_TERMS = re.compile(r"fall|heart|blood|glucose|oxygen")
+    
     def __init__(self, config: Config):
         """
         Initialize the Emergency Response Agent.
@@ -44,6 +48,15 @@ class EmergencyResponseAgent(BaseAgent):
         
         # Track caregiver notifications
         self.caregiver_notifications = {}
+        
+        # Message dispatch table (message type -> handler)
+        self._message_handlers = {
+            "emergency": self._handle_emergency,
+            "alert": self._handle_alert,
+            "resolve_emergency": self._handle_resolve_emergency,
+            "get_status": self._handle_get_status,
+            "update_contacts": self._handle_update_contacts
+        }
     
     async def initialize(self) -> None:
         """
@@ -619,98 +632,149 @@ class EmergencyResponseAgent(BaseAgent):
         """
         message_type = message.get("type", "unknown")
         
-        if message_type == "emergency":
-            user_id = message.get("user_id")
-            emergency_data = message.get("emergency_data", {})
+        handler = self._message_handlers.get(message_type)
+        if handler is None:
+            return {
+                "status": "error",
+                "message": f"Unknown message type: {message_type}"
+            }
+        
+        return await handler(message)
+    
+    async def _handle_emergency(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "emergency" message.
+        
+        Args:
+            message: Message to process
             
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in emergency request"
-                }
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        emergency_data = message.get("emergency_data", {})
+        
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in emergency request"
+            }
+        
+        return await self.handle_emergency({
+            "user_id": user_id,
+            **emergency_data
+        })
+    
+    async def _handle_alert(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "alert" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.handle_emergency({
-                "user_id": user_id,
-                **emergency_data
-            })
-        
-        elif message_type == "alert":
-            user_id = message.get("user_id")
-            alert = message.get("alert", {})
-            context = message.get("context", {})
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        alert = message.get("alert", {})
+        context = message.get("context", {})
+        
+        if not user_id or not alert:
+            return {
+                "status": "error",
+                "message": "Missing user_id or alert in alert request"
+            }
+        
+        # Convert alert to emergency
+        emergency_type = "unknown"
+        details = {}
+        
+        if "type" in alert:
+            # Find all classifying terms in a single scan of the alert type
+            alert_terms = set(self.ALERT_TERMS.findall(alert["type"]))
             
-            if not user_id or not alert:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id or alert in alert request"
+            if "fall" in alert_terms:
+                emergency_type = "fall"
+                details = {
+                    "location": context.get("current_location", "unknown"),
+                    "impact_force_level": alert.get("impact_force", "medium"),
+                    "source": alert.get("source", "unknown")
                 }
-            
-            # Convert alert to emergency
-            emergency_type = "unknown"
-            details = {}
-            
-            if "type" in alert:
-                if "fall" in alert["type"]:
-                    emergency_type = "fall"
-                    details = {
-                        "location": context.get("current_location", "unknown"),
-                        "impact_force_level": alert.get("impact_force", "medium"),
-                        "source": alert.get("source", "unknown")
-                    }
-                elif any(health_term in alert["type"] for health_term in ["heart", "blood", "glucose", "oxygen"]):
-                    emergency_type = "health"
-                    details = {
-                        "metric": alert.get("type", "unknown"),
-                        "value": alert.get("value", "unknown"),
-                        "threshold": alert.get("threshold", "unknown"),
-                        "source": alert.get("source", "unknown")
-                    }
-            
-            return await self.handle_emergency({
-                "user_id": user_id,
-                "type": emergency_type,
-                "details": details,
-                "location": context.get("current_location", "unknown")
-            })
-        
-        elif message_type == "resolve_emergency":
-            user_id = message.get("user_id")
-            emergency_id = message.get("emergency_id")
-            resolution_details = message.get("resolution_details")
-            
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in resolve_emergency request"
+            elif alert_terms:
+                emergency_type = "health"
+                details = {
+                    "metric": alert.get("type", "unknown"),
+                    "value": alert.get("value", "unknown"),
+                    "threshold": alert.get("threshold", "unknown"),
+                    "source": alert.get("source", "unknown")
                 }
-            
-            return await self.resolve_emergency(user_id, emergency_id, resolution_details)
         
-        elif message_type == "get_status":
-            user_id = message.get("user_id")
-            
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in get_status request"
-                }
+        return await self.handle_emergency({
+            "user_id": user_id,
+            "type": emergency_type,
+            "details": details,
+            "location": context.get("current_location", "unknown")
+        })
+    
+    async def _handle_resolve_emergency(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "resolve_emergency" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.get_emergency_status(user_id)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        emergency_id = message.get("emergency_id")
+        resolution_details = message.get("resolution_details")
+        
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in resolve_emergency request"
+            }
         
-        elif message_type == "update_contacts":
-            user_id = message.get("user_id")
-            contacts = message.get("contacts", [])
+        return await self.resolve_emergency(user_id, emergency_id, resolution_details)
+    
+    async def _handle_get_status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "get_status" message.
+        
+        Args:
+            message: Message to process
             
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in update_contacts request"
-                }
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in get_status request"
+            }
+        
+        return await self.get_emergency_status(user_id)
+    
+    async def _handle_update_contacts(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "update_contacts" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.update_emergency_contacts(user_id, contacts)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        contacts = message.get("contacts", [])
         
-        else:
+        if not user_id:
             return {
                 "status": "error",
-                "message": f"Unknown message type: {message_type}"
+                "message": "Missing user_id in update_contacts request"
             }
+        
+        return await self.update_emergency_contacts(user_id, contacts)
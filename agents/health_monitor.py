@@ -5,6 +5,8 @@ Monitors health metrics and detects anomalies.
 
 import asyncio
 import json
+from collections import deque
+from itertools import islice
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -37,6 +39,13 @@ class HealthMonitorAgent(BaseAgent):
         # Cache for health analyses
         self.health_analyses = {}
         self.analysis_timestamps = {}
+        
+        # Message dispatch table (message type -> handler)
+        self._message_handlers = {
+            "health_data": self._handle_health_data,
+            "get_status": self._handle_get_status,
+            "update_thresholds": self._handle_update_thresholds
+        }
     
     async def initialize(self) -> None:
         """
@@ -60,7 +69,7 @@ class HealthMonitorAgent(BaseAgent):
         """
         self.user_data[user_id] = {
             "health_history": [],
-            "alert_history": [],
+            "alert_history": deque(maxlen=20),  # Keep only recent alerts (last 20)
             "personalized_thresholds": self._get_default_thresholds()
         }
         
@@ -194,9 +203,6 @@ class HealthMonitorAgent(BaseAgent):
                     if alerts:
                         self.user_data[user_id]["alert_history"].extend(alerts)
                         
-                        # Keep only recent alerts (last 20)
-                        self.user_data[user_id]["alert_history"] = self.user_data[user_id]["alert_history"][-20:]
-                        
                         # Report alerts to coordination agent
                         await self._report_alerts(user_id, alerts)
     
@@ -421,9 +427,6 @@ class HealthMonitorAgent(BaseAgent):
         # Add alerts to history
         if alerts:
             self.user_data[user_id]["alert_history"].extend(alerts)
-            
-            # Keep history manageable (last 20 entries)
-            self.user_data[user_id]["alert_history"] = self.user_data[user_id]["alert_history"][-20:]
         
         # Generate LLM analysis if there are alerts
         llm_analysis = ""
@@ -552,7 +555,8 @@ class HealthMonitorAgent(BaseAgent):
         # Get recent alerts
         recent_alerts = []
         if user_id in self.user_data and "alert_history" in self.user_data[user_id]:
-            recent_alerts = self.user_data[user_id]["alert_history"][-5:]  # Last 5 alerts
+            alert_history = self.user_data[user_id]["alert_history"]
+            recent_alerts = list(islice(alert_history, max(0, len(alert_history) - 5), None))  # Last 5 alerts
         
         return {
             "status": "success",
@@ -598,49 +602,79 @@ class HealthMonitorAgent(BaseAgent):
         """
         message_type = message.get("type", "unknown")
         
-        if message_type == "health_data":
-            return await self.process_health_data(message.get("data", {}))
+        handler = self._message_handlers.get(message_type)
+        if handler is None:
+            return {
+                "status": "error",
+                "message": f"Unknown message type: {message_type}"
+            }
         
-        elif message_type == "get_status":
-            user_id = message.get("user_id")
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in get_status request"
-                }
+        return await handler(message)
+    
+    async def _handle_health_data(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "health_data" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.get_health_status(user_id)
+        Returns:
+            Response to the message
+        """
+        return await self.process_health_data(message.get("data", {}))
+    
+    async def _handle_get_status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "get_status" message.
         
-        elif message_type == "update_thresholds":
-            user_id = message.get("user_id")
-            thresholds = message.get("thresholds", {})
+        Args:
+            message: Message to process
             
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in update_thresholds request"
-                }
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in get_status request"
+            }
+        
+        return await self.get_health_status(user_id)
+    
+    async def _handle_update_thresholds(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "update_thresholds" message.
+        
+        Args:
+            message: Message to process
             
-            # Update thresholds
-            if user_id in self.user_data:
-                if "personalized_thresholds" in self.user_data[user_id]:
-                    self.user_data[user_id]["personalized_thresholds"].update(thresholds)
-                else:
-                    self.user_data[user_id]["personalized_thresholds"] = thresholds
-                
-                return {
-                    "status": "success",
-                    "message": f"Updated thresholds for user {user_id}",
-                    "thresholds": self.user_data[user_id]["personalized_thresholds"]
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": f"User {user_id} not found"
-                }
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        thresholds = message.get("thresholds", {})
         
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in update_thresholds request"
+            }
+        
+        # Update thresholds
+        if user_id in self.user_data:
+            if "personalized_thresholds" in self.user_data[user_id]:
+                self.user_data[user_id]["personalized_thresholds"].update(thresholds)
+            else:
+                self.user_data[user_id]["personalized_thresholds"] = thresholds
+            
+            return {
+                "status": "success",
+                "message": f"Updated thresholds for user {user_id}",
+                "thresholds": self.user_data[user_id]["personalized_thresholds"]
+            }
         else:
             return {
                 "status": "error",
-                "message": f"Unknown message type: {message_type}"
+                "message": f"User {user_id} not found"
             }
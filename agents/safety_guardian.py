@@ -5,6 +5,8 @@ Monitors movement patterns, detects falls, and ensures user safety.
 
 import asyncio
 import json
+from collections import deque
+from itertools import islice
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -42,6 +44,14 @@ class SafetyGuardianAgent(BaseAgent):
         self.inactivity_thresholds = {}
         for room, settings in self.room_settings.items():
             self.inactivity_thresholds[room] = settings.get("inactivity_threshold", 120)
+        
+        # Message dispatch table (message type -> handler)
+        self._message_handlers = {
+            "safety_data": self._handle_safety_data,
+            "get_status": self._handle_get_status,
+            "update_room_settings": self._handle_update_room_settings,
+            "update_inactivity_threshold": self._handle_update_inactivity_threshold
+        }
     
     async def initialize(self) -> None:
         """
@@ -67,7 +77,7 @@ class SafetyGuardianAgent(BaseAgent):
             "movement_history": [],
             "location_history": [],
             "fall_history": [],
-            "alert_history": [],
+            "alert_history": deque(maxlen=20),  # Keep only recent alerts (last 20)
             "last_activity": None,
             "last_location": None,
             "last_movement_time": None,
@@ -167,9 +177,6 @@ class SafetyGuardianAgent(BaseAgent):
                     if inactivity_alerts:
                         self.user_data[user_id]["alert_history"].extend(inactivity_alerts)
                         
-                        # Keep only recent alerts (last 20)
-                        self.user_data[user_id]["alert_history"] = self.user_data[user_id]["alert_history"][-20:]
-                        
                         # Report alerts to coordination agent
                         await self._report_alerts(user_id, inactivity_alerts)
     
@@ -337,9 +344,6 @@ class SafetyGuardianAgent(BaseAgent):
         # Add alerts to history
         if alerts:
             self.user_data[user_id]["alert_history"].extend(alerts)
-            
-            # Keep history manageable (last 20 entries)
-            self.user_data[user_id]["alert_history"] = self.user_data[user_id]["alert_history"][-20:]
         
         # Generate LLM analysis if there are alerts or a fall
         llm_analysis = ""
@@ -598,7 +602,8 @@ class SafetyGuardianAgent(BaseAgent):
         # Get recent alerts
         recent_alerts = []
         if user_id in self.user_data and "alert_history" in self.user_data[user_id]:
-            recent_alerts = self.user_data[user_id]["alert_history"][-5:]  # Last 5 alerts
+            alert_history = self.user_data[user_id]["alert_history"]
+            recent_alerts = list(islice(alert_history, max(0, len(alert_history) - 5), None))  # Last 5 alerts
         
         return {
             "status": "success",
@@ -731,46 +736,85 @@ class SafetyGuardianAgent(BaseAgent):
         """
         message_type = message.get("type", "unknown")
         
-        if message_type == "safety_data":
-            return await self.process_safety_data(message.get("data", {}))
+        handler = self._message_handlers.get(message_type)
+        if handler is None:
+            return {
+                "status": "error",
+                "message": f"Unknown message type: {message_type}"
+            }
         
-        elif message_type == "get_status":
-            user_id = message.get("user_id")
-            if not user_id:
-                return {
-                    "status": "error",
-                    "message": "Missing user_id in get_status request"
-                }
-            
-            return await self.get_safety_status(user_id)
+        return await handler(message)
+    
+    async def _handle_safety_data(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "safety_data" message.
         
-        elif message_type == "update_room_settings":
-            room_name = message.get("room_name")
-            settings = message.get("settings", {})
+        Args:
+            message: Message to process
             
-            if not room_name:
-                return {
-                    "status": "error",
-                    "message": "Missing room_name in update_room_settings request"
-                }
+        Returns:
+            Response to the message
+        """
+        return await self.process_safety_data(message.get("data", {}))
+    
+    async def _handle_get_status(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a "get_status" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.update_room_settings(room_name, settings)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        if not user_id:
+            return {
+                "status": "error",
+                "message": "Missing user_id in get_status request"
+            }
+        
+        return await self.get_safety_status(user_id)
+    
+    async def _handle_update_room_settings(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "update_room_settings" message.
         
-        elif message_type == "update_inactivity_threshold":
-            user_id = message.get("user_id")
-            room = message.get("room")
-            threshold_minutes = message.get("threshold_minutes")
+        Args:
+            message: Message to process
             
-            if not user_id or not room or not threshold_minutes:
-                return {
-                    "status": "error",
-                    "message": "Missing parameters in update_inactivity_threshold request"
-                }
+        Returns:
+            Response to the message
+        """
+        room_name = message.get("room_name")
+        settings = message.get("settings", {})
+        
+        if not room_name:
+            return {
+                "status": "error",
+                "message": "Missing room_name in update_room_settings request"
+            }
+        
+        return await self.update_room_settings(room_name, settings)
+    
+    async def _handle_update_inactivity_threshold(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an "update_inactivity_threshold" message.
+        
+        Args:
+            message: Message to process
             
-            return await self.update_inactivity_threshold(user_id, room, threshold_minutes)
+        Returns:
+            Response to the message
+        """
+        user_id = message.get("user_id")
+        room = message.get("room")
+        threshold_minutes = message.get("threshold_minutes")
         
-        else:
+        if not user_id or not room or not threshold_minutes:
             return {
                 "status": "error",
-                "message": f"Unknown message type: {message_type}"
+                "message": "Missing parameters in update_inactivity_threshold request"
             }
+        
+        return await self.update_inactivity_threshold(user_id, room, threshold_minutes)
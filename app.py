@@ -5,6 +5,7 @@ Initializes and coordinates all agents and components.
 
 import asyncio
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import argparse
@@ -31,8 +32,18 @@ logger = setup_logger("app")
 # Global variables for clean shutdown
 agents = []
 running = True
+stop_event = None
 sim_task = None
 
+# Columns the simulation actually forwards to the agents
+SIMULATION_COLUMNS = {
+    "safety": ["Device-ID/User-ID", "Location", "Movement Activity", "Fall Detected (Yes/No)",
+               "Impact Force Level", "Post-Fall Inactivity Duration (Seconds)"],
+    "health": ["Device-ID/User-ID", "Heart Rate", "Blood Pressure", "Glucose Levels",
+               "Oxygen Saturation (SpO₂%)"],
+    "reminder": ["Device-ID/User-ID", "Reminder Type", "Scheduled Time"]
+}
+
 async def initialize_system(config: Config) -> Dict[str, Any]:
     """
     Initialize the CareCompanion system.
@@ -91,6 +102,18 @@ async def initialize_system(config: Config) -> Dict[str, Any]:
         "coordination_agent": coordination_agent
     }
 
+def group_by_user(data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Split a data frame into per-user frames.
+    
+    Args:
+        data: Data frame with a Device-ID/User-ID column
+        
+    Returns:
+        Dictionary mapping user ID to that user's records
+    """
+    return {user_id: group for user_id, group in data.groupby("Device-ID/User-ID", sort=False)}
+
 async def data_simulation(coordination_agent: CoordinationAgent) -> None:
     """
     Run a simulation of incoming data for testing.
@@ -100,25 +123,39 @@ async def data_simulation(coordination_agent: CoordinationAgent) -> None:
     """
     logger.info("Starting data simulation...")
     
-    # Load and preprocess data
+    # Load and preprocess data (multithreaded pyarrow parser, needed columns only).
+    # Reads run in worker threads so the event loop stays responsive.
     try:
-        safety_data = pd.read_csv("data/safety_monitoring.csv")
-        health_data = pd.read_csv("data/health_monitoring.csv")
-        reminder_data = pd.read_csv("data/daily_reminder.csv")
+        safety_data, health_data, reminder_data = await asyncio.gather(
+            asyncio.to_thread(pd.read_csv, "data/safety_monitoring.csv", engine="pyarrow",
+                              usecols=SIMULATION_COLUMNS["safety"]),
+            asyncio.to_thread(pd.read_csv, "data/health_monitoring.csv", engine="pyarrow",
+                              usecols=SIMULATION_COLUMNS["health"]),
+            asyncio.to_thread(pd.read_csv, "data/daily_reminder.csv", engine="pyarrow",
+                              usecols=SIMULATION_COLUMNS["reminder"],
+                              dtype={"Scheduled Time": str})  # "HH:MM:SS" strings, not datetime.time objects
+        )
         
         logger.info(f"Loaded data files: {len(safety_data)} safety records, {len(health_data)} health records, {len(reminder_data)} reminder records")
     except Exception as e:
         logger.error(f"Error loading data: {e}")
         return
     
-    # Get unique user IDs
-    user_ids = set(safety_data["Device-ID/User-ID"].unique())
-    user_ids.update(health_data["Device-ID/User-ID"].unique())
-    user_ids.update(reminder_data["Device-ID/User-ID"].unique())
-    
-    user_ids = sorted(list(user_ids))
+    # Get unique user IDs (np.unique returns them already sorted)
+    user_ids = np.unique(np.concatenate([
+        safety_data["Device-ID/User-ID"].to_numpy(),
+        health_data["Device-ID/User-ID"].to_numpy(),
+        reminder_data["Device-ID/User-ID"].to_numpy()
+    ])).tolist()
     logger.info(f"Found {len(user_ids)} unique users in data")
     
+    # Index records by user once instead of filtering on every iteration
+    health_by_user, safety_by_user, reminder_by_user = await asyncio.gather(
+        asyncio.to_thread(group_by_user, health_data),
+        asyncio.to_thread(group_by_user, safety_data),
+        asyncio.to_thread(group_by_user, reminder_data)
+    )
+    
     # Simulation loop
     global running
     while running:
@@ -131,8 +168,8 @@ async def data_simulation(coordination_agent: CoordinationAgent) -> None:
             
             if data_type == "health":
                 # Get random health record for this user
-                user_health = health_data[health_data["Device-ID/User-ID"] == user_id]
-                if len(user_health) > 0:
+                user_health = health_by_user.get(user_id)
+                if user_health is not None:
                     record = user_health.sample(1).iloc[0].to_dict()
                     
                     # Send to coordination agent
@@ -155,8 +192,8 @@ async def data_simulation(coordination_agent: CoordinationAgent) -> None:
             
             elif data_type == "safety":
                 # Get random safety record for this user
-                user_safety = safety_data[safety_data["Device-ID/User-ID"] == user_id]
-                if len(user_safety) > 0:
+                user_safety = safety_by_user.get(user_id)
+                if user_safety is not None:
                     record = user_safety.sample(1).iloc[0].to_dict()
                     
                     # Send to coordination agent
@@ -180,8 +217,8 @@ async def data_simulation(coordination_agent: CoordinationAgent) -> None:
             
             elif data_type == "reminder":
                 # Get random reminder record for this user
-                user_reminder = reminder_data[reminder_data["Device-ID/User-ID"] == user_id]
-                if len(user_reminder) > 0:
+                user_reminder = reminder_by_user.get(user_id)
+                if user_reminder is not None:
                     record = user_reminder.sample(1).iloc[0].to_dict()
                     
                     # Randomly decide if acknowledged
@@ -211,13 +248,17 @@ async def data_simulation(coordination_agent: CoordinationAgent) -> None:
             logger.error(f"Error in simulation: {e}")
             await asyncio.sleep(1)
 
-def handle_exit(signum, frame):
+def handle_exit(signum=None, frame=None):
     """
     Handle exit signals for clean shutdown.
     """
     logger.info("Received exit signal, shutting down...")
     global running
     running = False
+    
+    # Wake up the main loop immediately
+    if stop_event is not None:
+        stop_event.set()
 
 async def shutdown_system():
     """
@@ -241,7 +282,8 @@ async def shutdown_system():
     # Save database state
     db_path = "data/carecompanion.db"
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    db.save_to_file(db_path)
+    # Serialize and write in a worker thread so the event loop is not blocked
+    await asyncio.to_thread(db.save_to_file, db_path)
     logger.info(f"Database state saved to {db_path}")
     
     logger.info("Shutdown complete")
@@ -260,8 +302,15 @@ async def main():
     config = Config(args.config)
     
     # Register signal handlers for clean shutdown
-    signal.signal(signal.SIGINT, handle_exit)
-    signal.signal(signal.SIGTERM, handle_exit)
+    global stop_event
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_exit)
+        except NotImplementedError:
+            # Event loop signal handlers are not available on Windows
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(handle_exit))
     
     try:
         # Initialize system
@@ -276,10 +325,8 @@ async def main():
             sim_task = asyncio.create_task(data_simulation(coordination_agent))
         
         # Main application loop
-        global running
-        while running:
-            # In a real application, this would handle UI events, API requests, etc.
-            await asyncio.sleep(1)
+        # In a real application, this would handle UI events, API requests, etc.
+        await stop_event.wait()
     
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
@@ -4,6 +4,9 @@ Provides functions for data analysis and processing.
 """
 
 import os
+import asyncio
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
@@ -14,11 +17,25 @@ from utils.config import config
 
 logger = setup_logger("analytics")
 
+# Low-cardinality string columns stored as categoricals
+CATEGORICAL_COLUMNS = ["Device-ID/User-ID", "Movement Activity", "Location", "Impact Force Level", "Reminder Type"]
+
+# Narrow integer types for numeric readings (int64 by default)
+DTYPE_MAP = {
+    "Heart Rate": "int16",
+    "Glucose Levels": "int16",
+    "Oxygen Saturation (SpO₂%)": "int8",
+    "Post-Fall Inactivity Duration (Seconds)": "int32"
+}
+
 class DataAnalyzer:
     """
     Data analysis utilities for the CareCompanion system.
     """
     
+    # Maximum number of cached comprehensive status reports
+    STATUS_CACHE_SIZE = 256
+    
     def __init__(self):
         """
         Initialize the DataAnalyzer.
@@ -28,18 +45,31 @@ class DataAnalyzer:
         self.safety_data = None
         self.reminder_data = None
         
+        # Per-user partitions of each dataset
+        self._health_by_user: Dict[str, pd.DataFrame] = {}
+        self._safety_by_user: Dict[str, pd.DataFrame] = {}
+        self._reminder_by_user: Dict[str, pd.DataFrame] = {}
+        self._user_ids = []
+        
+        # Latest modification time of the loaded files; part of the status cache key
+        self._data_version = 0.0
+        
+        # LRU cache of comprehensive status reports keyed on (user_id, data version)
+        self._status_cache = OrderedDict()
+        
         # Load data if available
         self._load_data()
     
     def _load_data(self) -> None:
         """
-        Load data from CSV files.
+        Load data from CSV files (via their Parquet cache).
         """
         try:
             # Health monitoring data
             health_path = os.path.join(self.data_path, "health_monitoring.csv")
             if os.path.exists(health_path):
-                self.health_data = pd.read_csv(health_path)
+                self.health_data = self._load_dataset(health_path)
+                self._health_by_user = self._group_by_user(self.health_data)
                 logger.info(f"Loaded health data: {len(self.health_data)} records")
             else:
                 logger.warning(f"Health data file not found at {health_path}")
@@ -47,7 +77,8 @@ class DataAnalyzer:
             # Safety monitoring data
             safety_path = os.path.join(self.data_path, "safety_monitoring.csv")
             if os.path.exists(safety_path):
-                self.safety_data = pd.read_csv(safety_path)
+                self.safety_data = self._load_dataset(safety_path)
+                self._safety_by_user = self._group_by_user(self.safety_data)
                 logger.info(f"Loaded safety data: {len(self.safety_data)} records")
             else:
                 logger.warning(f"Safety data file not found at {safety_path}")
@@ -55,33 +86,143 @@ class DataAnalyzer:
             # Reminder data
             reminder_path = os.path.join(self.data_path, "daily_reminder.csv")
             if os.path.exists(reminder_path):
-                self.reminder_data = pd.read_csv(reminder_path)
+                self.reminder_data = self._load_dataset(reminder_path)
+                self._reminder_by_user = self._group_by_user(self.reminder_data)
                 logger.info(f"Loaded reminder data: {len(self.reminder_data)} records")
             else:
                 logger.warning(f"Reminder data file not found at {reminder_path}")
+            
+            # Precompute the sorted list of user IDs across all datasets
+            self._user_ids = sorted(
+                set(self._health_by_user) | set(self._safety_by_user) | set(self._reminder_by_user)
+            )
+            
+            # Record the data version so cached results are tied to the files they came from
+            self._data_version = max(
+                (os.path.getmtime(p) for p in (health_path, safety_path, reminder_path) if os.path.exists(p)),
+                default=0.0
+            )
         
         except Exception as e:
             logger.error(f"Error loading data: {e}")
     
-    def get_user_ids(self) -> List[str]:
+    def _load_dataset(self, csv_path: str) -> pd.DataFrame:
         """
-        Get a list of unique user IDs across all datasets.
+        Load a dataset and prepare it for per-user analysis.
         
+        Args:
+            csv_path: Path to the source CSV file
+            
         Returns:
-            List of unique user IDs
+            DataFrame with optimized dtypes and parsed timestamps, sorted by timestamp
+        """
+        data = self._optimize_dtypes(self._load_or_convert(csv_path))
+        
+        # Parse timestamps once and order records chronologically
+        data["Timestamp"] = pd.to_datetime(data["Timestamp"], cache=True)
+        return data.sort_values("Timestamp", kind="stable")
+    
+    def _load_or_convert(self, csv_path: str) -> pd.DataFrame:
+        """
+        Load a dataset from its Parquet cache, converting the CSV on first use.
+        
+        The cache sits next to the CSV and is rebuilt whenever the CSV is newer.
+        
+        Args:
+            csv_path: Path to the source CSV file
+            
+        Returns:
+            DataFrame with the dataset
         """
-        user_ids = set()
+        parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
         
-        if self.health_data is not None:
-            user_ids.update(self.health_data["Device-ID/User-ID"].unique())
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            return pd.read_parquet(parquet_path)
         
-        if self.safety_data is not None:
-            user_ids.update(self.safety_data["Device-ID/User-ID"].unique())
+        # Arrow's multithreaded parser; times of day stay strings instead of being inferred as time objects
+        data = pd.read_csv(csv_path, engine="pyarrow", dtype={"Scheduled Time": str})
         
-        if self.reminder_data is not None:
-            user_ids.update(self.reminder_data["Device-ID/User-ID"].unique())
+        try:
+            data.to_parquet(parquet_path, compression="zstd", index=False)
+            logger.info(f"Cached {csv_path} as {parquet_path}")
+        except Exception as e:
+            logger.warning(f"Could not write Parquet cache {parquet_path}: {e}")
+        
+        return data
+    
+    @staticmethod
+    def _optimize_dtypes(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store low-cardinality string columns as categoricals, downcast integer
+        readings, and add a boolean "<column>_b" column for every Yes/No column.
         
-        return sorted(list(user_ids))
+        Args:
+            data: Raw dataset
+            
+        Returns:
+            The same DataFrame with converted columns
+        """
+        for column in list(data.columns):
+            if column.endswith("(Yes/No)"):
+                data[column + "_b"] = (data[column] == "Yes").to_numpy()
+                data[column] = data[column].astype("category")
+            elif column in CATEGORICAL_COLUMNS:
+                data[column] = data[column].astype("category")
+            elif column in DTYPE_MAP and pd.api.types.is_integer_dtype(data[column]):
+                # Columns with missing values were read as float and are left as is
+                data[column] = data[column].astype(DTYPE_MAP[column])
+        
+        return data
+    
+    @staticmethod
+    def _value_counts(series: pd.Series) -> pd.Series:
+        """
+        Count values, leaving out categories that do not occur.
+        
+        Args:
+            series: Series to count
+            
+        Returns:
+            Counts sorted in descending order
+        """
+        counts = series.value_counts()
+        return counts[counts > 0]
+    
+    @staticmethod
+    def _mmm(values: np.ndarray) -> Tuple[float, Any, Any]:
+        """
+        Compute mean, min and max of an array, ignoring missing values.
+        
+        Args:
+            values: Array of numeric values
+            
+        Returns:
+            Tuple of (mean, min, max)
+        """
+        return float(np.nanmean(values)), np.nanmin(values), np.nanmax(values)
+    
+    @staticmethod
+    def _group_by_user(data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Partition a dataset by user ID in a single pass, so per-user lookups
+        avoid scanning the whole dataset.
+        
+        Args:
+            data: DataFrame with a Device-ID/User-ID column
+            
+        Returns:
+            Dictionary mapping user ID to that user's records, in timestamp order
+        """
+        return dict(tuple(data.groupby("Device-ID/User-ID", sort=False, observed=True)))
+    
+    def get_user_ids(self) -> List[str]:
+        """
+        Get a list of unique user IDs across all datasets.
+        
+        Returns:
+            List of unique user IDs
+        """
+        return self._user_ids
     
     def get_user_health_data(self, user_id: str) -> Optional[pd.DataFrame]:
         """
@@ -97,11 +238,10 @@ class DataAnalyzer:
             logger.warning("Health data not loaded")
             return None
         
-        user_data = self.health_data[self.health_data["Device-ID/User-ID"] == user_id]
+        user_data = self._health_by_user.get(user_id)
         
-        if len(user_data) == 0:
+        if user_data is None:
             logger.warning(f"No health data found for user {user_id}")
-            return None
         
         return user_data
     
@@ -119,11 +259,10 @@ class DataAnalyzer:
             logger.warning("Safety data not loaded")
             return None
         
-        user_data = self.safety_data[self.safety_data["Device-ID/User-ID"] == user_id]
+        user_data = self._safety_by_user.get(user_id)
         
-        if len(user_data) == 0:
+        if user_data is None:
             logger.warning(f"No safety data found for user {user_id}")
-            return None
         
         return user_data
     
@@ -141,11 +280,10 @@ class DataAnalyzer:
             logger.warning("Reminder data not loaded")
             return None
         
-        user_data = self.reminder_data[self.reminder_data["Device-ID/User-ID"] == user_id]
+        user_data = self._reminder_by_user.get(user_id)
         
-        if len(user_data) == 0:
+        if user_data is None:
             logger.warning(f"No reminder data found for user {user_id}")
-            return None
         
         return user_data
     
@@ -168,40 +306,31 @@ class DataAnalyzer:
             }
         
         try:
-            # Convert timestamp to datetime for sorting
-            user_data = user_data.copy()
-            user_data["Timestamp"] = pd.to_datetime(user_data["Timestamp"])
-            
-            # Sort by timestamp
-            user_data = user_data.sort_values("Timestamp")
-            
-            # Get the most recent reading
+            # Get the most recent reading (records are kept in timestamp order)
             latest = user_data.iloc[-1]
             
+            # Compute mean/min/max for the numeric vitals directly on the column arrays
+            hr_mean, hr_min, hr_max = self._mmm(user_data["Heart Rate"].to_numpy())
+            glucose_mean, glucose_min, glucose_max = self._mmm(user_data["Glucose Levels"].to_numpy())
+            oxygen_mean, oxygen_min, oxygen_max = self._mmm(user_data["Oxygen Saturation (SpO₂%)"].to_numpy())
+            
             # Calculate statistics for heart rate
             hr_stats = {
                 "current": int(latest["Heart Rate"]),
-                "mean": float(user_data["Heart Rate"].mean()),
-                "min": int(user_data["Heart Rate"].min()),
-                "max": int(user_data["Heart Rate"].max()),
+                "mean": hr_mean,
+                "min": int(hr_min),
+                "max": int(hr_max),
                 "above_threshold": latest["Heart Rate Below/Above Threshold (Yes/No)"] == "Yes"
             }
             
-            # Process blood pressure
-            bp_values = []
-            bp_systolic = []
-            bp_diastolic = []
-            
-            for bp in user_data["Blood Pressure"]:
-                try:
-                    parts = bp.split("/")
-                    systolic = int(parts[0].strip())
-                    diastolic = int(parts[1].split(" ")[0].strip())
-                    bp_systolic.append(systolic)
-                    bp_diastolic.append(diastolic)
-                    bp_values.append((systolic, diastolic))
-                except:
-                    pass
+            # Process blood pressure ("120/80 mmHg"), parsing the whole column at once;
+            # unparseable readings become NaN and are skipped
+            bp = user_data["Blood Pressure"].str.extract(r"(?P<systolic>\d+)\s*/\s*(?P<diastolic>\d+)").astype(float)
+            bp = bp.dropna()
+            has_bp = len(bp) > 0
+            if has_bp:
+                systolic_mean, systolic_min, systolic_max = self._mmm(bp["systolic"].to_numpy())
+                diastolic_mean, diastolic_min, diastolic_max = self._mmm(bp["diastolic"].to_numpy())
             
             latest_bp = latest["Blood Pressure"]
             latest_bp_parts = latest_bp.split("/")
@@ -212,35 +341,35 @@ class DataAnalyzer:
                 "current": latest_bp,
                 "current_systolic": latest_systolic,
                 "current_diastolic": latest_diastolic,
-                "mean_systolic": float(np.mean(bp_systolic)) if bp_systolic else None,
-                "mean_diastolic": float(np.mean(bp_diastolic)) if bp_diastolic else None,
-                "min_systolic": int(min(bp_systolic)) if bp_systolic else None,
-                "max_systolic": int(max(bp_systolic)) if bp_systolic else None,
-                "min_diastolic": int(min(bp_diastolic)) if bp_diastolic else None,
-                "max_diastolic": int(max(bp_diastolic)) if bp_diastolic else None,
+                "mean_systolic": systolic_mean if has_bp else None,
+                "mean_diastolic": diastolic_mean if has_bp else None,
+                "min_systolic": int(systolic_min) if has_bp else None,
+                "max_systolic": int(systolic_max) if has_bp else None,
+                "min_diastolic": int(diastolic_min) if has_bp else None,
+                "max_diastolic": int(diastolic_max) if has_bp else None,
                 "above_threshold": latest["Blood Pressure Below/Above Threshold (Yes/No)"] == "Yes"
             }
             
             # Calculate statistics for glucose
             glucose_stats = {
                 "current": int(latest["Glucose Levels"]),
-                "mean": float(user_data["Glucose Levels"].mean()),
-                "min": int(user_data["Glucose Levels"].min()),
-                "max": int(user_data["Glucose Levels"].max()),
+                "mean": glucose_mean,
+                "min": int(glucose_min),
+                "max": int(glucose_max),
                 "above_threshold": latest["Glucose Levels Below/Above Threshold (Yes/No)"] == "Yes"
             }
             
             # Calculate statistics for oxygen
             oxygen_stats = {
                 "current": int(latest["Oxygen Saturation (SpO₂%)"]),
-                "mean": float(user_data["Oxygen Saturation (SpO₂%)"].mean()),
-                "min": int(user_data["Oxygen Saturation (SpO₂%)"].min()),
-                "max": int(user_data["Oxygen Saturation (SpO₂%)"].max()),
+                "mean": oxygen_mean,
+                "min": int(oxygen_min),
+                "max": int(oxygen_max),
                 "below_threshold": latest["SpO₂ Below Threshold (Yes/No)"] == "Yes"
             }
             
             # Count alerts
-            alert_count = len(user_data[user_data["Alert Triggered (Yes/No)"] == "Yes"])
+            alert_count = int(user_data["Alert Triggered (Yes/No)_b"].sum())
             
             # Check latest alerts
             latest_alert = latest["Alert Triggered (Yes/No)"] == "Yes"
@@ -308,26 +437,21 @@ class DataAnalyzer:
             }
         
         try:
-            # Convert timestamp to datetime for sorting
-            user_data = user_data.copy()
-            user_data["Timestamp"] = pd.to_datetime(user_data["Timestamp"])
-            
-            # Sort by timestamp
-            user_data = user_data.sort_values("Timestamp")
-            
-            # Get the most recent reading
+            # Get the most recent reading (records are kept in timestamp order)
             latest = user_data.iloc[-1]
             
             # Analyze movement activity
-            movement_counts = user_data["Movement Activity"].value_counts().to_dict()
-            most_common_activity = user_data["Movement Activity"].value_counts().idxmax()
+            movement_value_counts = self._value_counts(user_data["Movement Activity"])
+            movement_counts = movement_value_counts.to_dict()
+            most_common_activity = movement_value_counts.idxmax()
             
             # Analyze location
-            location_counts = user_data["Location"].value_counts().to_dict()
-            most_common_location = user_data["Location"].value_counts().idxmax()
+            location_value_counts = self._value_counts(user_data["Location"])
+            location_counts = location_value_counts.to_dict()
+            most_common_location = location_value_counts.idxmax()
             
             # Analyze falls
-            fall_count = len(user_data[user_data["Fall Detected (Yes/No)"] == "Yes"])
+            fall_count = int(user_data["Fall Detected (Yes/No)_b"].sum())
             has_falls = fall_count > 0
             
             latest_fall = latest["Fall Detected (Yes/No)"] == "Yes"
@@ -337,22 +461,20 @@ class DataAnalyzer:
             latest_caregiver_notified = latest["Caregiver Notified (Yes/No)"] == "Yes"
             
             # Calculate inactivity patterns
-            inactivity_count = len(user_data[user_data["Movement Activity"] == "No Movement"])
+            inactivity_count = int((user_data["Movement Activity"] == "No Movement").sum())
             inactivity_percentage = (inactivity_count / len(user_data)) * 100
             
             # Determine post-fall inactivity statistics
-            post_fall_times = user_data["Post-Fall Inactivity Duration (Seconds)"]
+            post_fall_mean, _, post_fall_max = self._mmm(user_data["Post-Fall Inactivity Duration (Seconds)"].to_numpy())
             post_fall_stats = {
-                "mean": float(post_fall_times.mean()),
-                "max": int(post_fall_times.max()),
+                "mean": post_fall_mean,
+                "max": int(post_fall_max),
                 "current": int(latest["Post-Fall Inactivity Duration (Seconds)"])
             }
             
-            # Analyze time spent in each location
-            location_times = {}
-            for location in location_counts.keys():
-                location_data = user_data[user_data["Location"] == location]
-                location_times[location] = len(location_data)
+            # Analyze time spent in each location (number of readings per location,
+            # which the location value counts above already hold)
+            location_times = dict(location_counts)
             
             # Determine overall safety status
             safety_concerns = []
@@ -422,61 +544,59 @@ class DataAnalyzer:
             }
         
         try:
-            # Convert timestamp to datetime for sorting
-            user_data = user_data.copy()
-            user_data["Timestamp"] = pd.to_datetime(user_data["Timestamp"])
-            
-            # Sort by timestamp
-            user_data = user_data.sort_values("Timestamp")
-            
-            # Get the most recent reading
+            # Get the most recent reading (records are kept in timestamp order)
             latest = user_data.iloc[-1]
             
             # Analyze reminder types
-            reminder_counts = user_data["Reminder Type"].value_counts().to_dict()
-            most_common_reminder = user_data["Reminder Type"].value_counts().idxmax()
+            reminder_value_counts = self._value_counts(user_data["Reminder Type"])
+            reminder_counts = reminder_value_counts.to_dict()
+            most_common_reminder = reminder_value_counts.idxmax()
             
             # Calculate reminder response rates
-            sent_reminders = user_data[user_data["Reminder Sent (Yes/No)"] == "Yes"]
-            acknowledged_reminders = sent_reminders[sent_reminders["Acknowledged (Yes/No)"] == "Yes"]
+            sent = user_data["Reminder Sent (Yes/No)_b"].to_numpy()
+            acknowledged = user_data["Acknowledged (Yes/No)_b"].to_numpy()
+            sent_reminders = user_data[sent]
             
-            sent_count = len(sent_reminders)
-            acknowledged_count = len(acknowledged_reminders)
+            sent_count = int(sent.sum())
+            acknowledged_count = int((sent & acknowledged).sum())
             
             if sent_count > 0:
                 acknowledgment_rate = (acknowledged_count / sent_count) * 100
             else:
                 acknowledgment_rate = 0
             
-            # Calculate acknowledgment rates by type
+            # Calculate acknowledgment rates by type in one grouped pass
+            # (types with no sent reminders get zero counts)
+            type_stats = sent_reminders.groupby("Reminder Type", observed=True)["Acknowledged (Yes/No)_b"].agg(
+                sent="count", acknowledged="sum"
+            ).reindex(list(reminder_counts), fill_value=0)
+            
             acknowledgment_by_type = {}
-            for reminder_type in reminder_counts.keys():
-                type_sent = sent_reminders[sent_reminders["Reminder Type"] == reminder_type]
-                type_acknowledged = type_sent[type_sent["Acknowledged (Yes/No)"] == "Yes"]
-                
-                if len(type_sent) > 0:
-                    rate = (len(type_acknowledged) / len(type_sent)) * 100
+            for reminder_type, type_sent, type_acknowledged in zip(
+                type_stats.index, type_stats["sent"].tolist(), type_stats["acknowledged"].tolist()
+            ):
+                if type_sent > 0:
+                    rate = (type_acknowledged / type_sent) * 100
                 else:
                     rate = 0
                 
                 acknowledgment_by_type[reminder_type] = {
-                    "sent": len(type_sent),
-                    "acknowledged": len(type_acknowledged),
+                    "sent": type_sent,
+                    "acknowledged": type_acknowledged,
                     "rate": rate
                 }
             
-            # Get upcoming reminders (we'll simulate this since there's no real-time data)
-            upcoming_reminders = []
-            for _, row in user_data.iterrows():
-                if row["Reminder Sent (Yes/No)"] == "No":
-                    upcoming_reminders.append({
-                        "type": row["Reminder Type"],
-                        "scheduled_time": row["Scheduled Time"],
-                        "timestamp": row["Timestamp"]
-                    })
-            
-            # Limit to next 5 upcoming reminders
-            upcoming_reminders = upcoming_reminders[:5]
+            # Get upcoming reminders (we'll simulate this since there's no real-time data),
+            # limited to the next 5
+            pending = user_data.loc[
+                user_data["Reminder Sent (Yes/No)"] == "No",
+                ["Reminder Type", "Scheduled Time", "Timestamp"]
+            ].head(5)
+            upcoming_reminders = pending.rename(columns={
+                "Reminder Type": "type",
+                "Scheduled Time": "scheduled_time",
+                "Timestamp": "timestamp"
+            }).to_dict(orient="records")
             
             # Determine overall reminder status
             reminder_concerns = []
@@ -520,16 +640,104 @@ class DataAnalyzer:
         """
         Get a comprehensive status report for a user combining all data sources.
         
+        Results are cached per user and data version, so repeated calls only
+        re-run the analyses when the loaded data changes.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Dictionary with comprehensive status information
+        """
+        status = self._get_cached_status(user_id)
+        
+        if status is None:
+            status = self._build_comprehensive_status(
+                user_id,
+                self.analyze_health_metrics(user_id),
+                self.analyze_safety_data(user_id),
+                self.analyze_reminder_data(user_id)
+            )
+            self._cache_status(user_id, status)
+        
+        return {**status, "timestamp": datetime.now().isoformat()}
+    
+    async def get_comprehensive_user_status_async(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get a comprehensive status report for a user, running the three
+        analyses concurrently in worker threads.
+        
+        Shares its cache with get_comprehensive_user_status.
+        
         Args:
             user_id: ID of the user
             
         Returns:
             Dictionary with comprehensive status information
         """
-        health_analysis = self.analyze_health_metrics(user_id)
-        safety_analysis = self.analyze_safety_data(user_id)
-        reminder_analysis = self.analyze_reminder_data(user_id)
+        status = self._get_cached_status(user_id)
+        
+        if status is None:
+            health_analysis, safety_analysis, reminder_analysis = await asyncio.gather(
+                asyncio.to_thread(self.analyze_health_metrics, user_id),
+                asyncio.to_thread(self.analyze_safety_data, user_id),
+                asyncio.to_thread(self.analyze_reminder_data, user_id)
+            )
+            status = self._build_comprehensive_status(user_id, health_analysis, safety_analysis, reminder_analysis)
+            self._cache_status(user_id, status)
+        
+        return {**status, "timestamp": datetime.now().isoformat()}
+    
+    def _get_cached_status(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached status report for the current data version.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Cached status report or None if not cached
+        """
+        key = (user_id, self._data_version)
+        status = self._status_cache.get(key)
+        
+        if status is not None:
+            self._status_cache.move_to_end(key)
+        
+        return status
+    
+    def _cache_status(self, user_id: str, status: Dict[str, Any]) -> None:
+        """
+        Cache a status report, evicting the least recently used entry.
+        
+        Args:
+            user_id: ID of the user
+            status: Status report to cache
+        """
+        self._status_cache[(user_id, self._data_version)] = status
+        
+        if len(self._status_cache) > self.STATUS_CACHE_SIZE:
+            self._status_cache.popitem(last=False)
+    
+    def _build_comprehensive_status(
+        self, 
+        user_id: str, 
+        health_analysis: Dict[str, Any], 
+        safety_analysis: Dict[str, Any], 
+        reminder_analysis: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Combine the individual analyses into a comprehensive status report.
         
+        Args:
+            user_id: ID of the user
+            health_analysis: Health analysis results
+            safety_analysis: Safety analysis results
+            reminder_analysis: Reminder analysis results
+            
+        Returns:
+            Dictionary with comprehensive status information
+        """
         # Determine overall well-being status
         overall_concerns = []
         
@@ -552,6 +760,7 @@ class DataAnalyzer:
         # Create a detailed status message
         status_message = self._generate_status_message(
             overall_status, 
+            overall_concerns, 
             health_analysis, 
             safety_analysis, 
             reminder_analysis
@@ -587,6 +796,7 @@ class DataAnalyzer:
     def _generate_status_message(
         self, 
         overall_status: str, 
+        overall_concerns: List[str], 
         health_analysis: Dict[str, Any], 
         safety_analysis: Dict[str, Any], 
         reminder_analysis: Dict[str, Any]
@@ -596,6 +806,7 @@ class DataAnalyzer:
         
         Args:
             overall_status: Overall status level
+            overall_concerns: Concerns collected from all analyses
             health_analysis: Health analysis results
             safety_analysis: Safety analysis results
             reminder_analysis: Reminder analysis results
@@ -603,65 +814,71 @@ class DataAnalyzer:
         Returns:
             Status message string
         """
+        # Collect the sentences and join them once at the end
         if overall_status == "normal":
-            message = "All systems normal. "
+            parts = ["All systems normal."]
             
             if health_analysis.get("status") == "success":
-                message += "Vital signs are within expected ranges. "
+                parts.append("Vital signs are within expected ranges.")
             
             if safety_analysis.get("status") == "success":
                 location = safety_analysis.get("current_location", "unknown location")
                 activity = safety_analysis.get("current_activity", "unknown activity")
-                message += f"Currently {activity} in the {location}. "
+                parts.append(f"Currently {activity} in the {location}.")
             
             if reminder_analysis.get("status") == "success":
                 ack_rate = reminder_analysis.get("acknowledgment_rate", 0)
-                message += f"Reminder acknowledgment rate is {ack_rate:.1f}%. "
+                parts.append(f"Reminder acknowledgment rate is {ack_rate:.1f}%.")
             
-            message += "No immediate concerns detected."
+            parts.append("No immediate concerns detected.")
         
         elif overall_status == "attention":
-            message = "Some issues require attention. "
+            parts = ["Some issues require attention."]
             
             # Add specific concerns
-            concerns = []
-            
-            if health_analysis.get("status") == "success":
-                concerns.extend(health_analysis.get("health_concerns", []))
-            
-            if safety_analysis.get("status") == "success":
-                concerns.extend(safety_analysis.get("safety_concerns", []))
+            if overall_concerns:
+                parts.append(f"Concerns: {'; '.join(overall_concerns)}.")
             
-            if reminder_analysis.get("status") == "success":
-                concerns.extend(reminder_analysis.get("reminder_concerns", []))
-            
-            if concerns:
-                message += "Concerns: " + "; ".join(concerns) + ". "
-            
-            message += "Please monitor these issues closely."
+            parts.append("Please monitor these issues closely.")
         
         else:  # alert
-            message = "ALERT: Immediate attention required. "
+            parts = ["ALERT: Immediate attention required."]
             
             # Add specific concerns
-            concerns = []
+            if overall_concerns:
+                parts.append(f"Critical issues: {'; '.join(overall_concerns)}.")
             
-            if health_analysis.get("status") == "success":
-                concerns.extend(health_analysis.get("health_concerns", []))
-            
-            if safety_analysis.get("status") == "success":
-                concerns.extend(safety_analysis.get("safety_concerns", []))
-            
-            if reminder_analysis.get("status") == "success":
-                concerns.extend(reminder_analysis.get("reminder_concerns", []))
-            
-            if concerns:
-                message += "Critical issues: " + "; ".join(concerns) + ". "
+            parts.append("Immediate action recommended.")
+        
+        return " ".join(parts)
+
+
+class _LazyAnalyzer:
+    """
+    Proxy for the shared DataAnalyzer that creates it on first use, so importing
+    this module does not load the datasets.
+    """
+    
+    _instance: Optional[DataAnalyzer] = None
+    _lock = threading.Lock()
+    
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward attribute access to the DataAnalyzer, creating it if needed.
+        
+        Args:
+            name: Attribute name
             
-            message += "Immediate action recommended."
+        Returns:
+            Attribute of the DataAnalyzer instance
+        """
+        if _LazyAnalyzer._instance is None:
+            with _LazyAnalyzer._lock:
+                if _LazyAnalyzer._instance is None:
+                    _LazyAnalyzer._instance = DataAnalyzer()
         
-        return message
+        return getattr(_LazyAnalyzer._instance, name)
 
 
-# Create a global analyzer instance
-analyzer = DataAnalyzer()
+# Create a global analyzer instance (data is loaded on first use)
+analyzer = _LazyAnalyzer()
@@ -5,8 +5,8 @@ Uses Ollama for local LLM inference.
 
 import ollama
 import time
-import asyncio
-from typing import Dict, Any, List, Optional
+from hashlib import blake2b
+from typing import Dict, Any, List, Optional, AsyncIterator
 
 from utils.logger import setup_logger
 from utils.config import config
@@ -18,6 +18,16 @@ class OllamaClient:
     Ollama LLM client for the CareCompanion system.
     """
     
+    # Maximum number of cached deterministic responses
+    RESPONSE_CACHE_SIZE = 256
+    
+    # Shared by every agent's client so they reuse one connection pool and one cache
+    _shared_client: Optional[ollama.AsyncClient] = None
+    
+    # Responses to deterministic (temperature 0) prompts, evicted in FIFO order.
+    # Keys include the model name, so clients for different models never collide.
+    _response_cache: Dict[bytes, str] = {}
+    
     def __init__(self, model_name: str = "mistral"):
         """
         Initialize the Ollama client.
@@ -26,8 +36,26 @@ class OllamaClient:
             model_name: Name of the Ollama model to use
         """
         self.model_name = model_name
+        
+        # How long Ollama keeps the model loaded after a request
+        self.keep_alive = config.get("llm.keep_alive", "30m")
+        
+        # Native asyncio client, so requests don't go through a worker thread
+        self._client = self._get_shared_client()
         logger.info(f"Initialized OllamaClient with model: {model_name}")
     
+    @classmethod
+    def _get_shared_client(cls) -> ollama.AsyncClient:
+        """
+        Get the Ollama client shared by all instances, creating it on first use.
+        
+        Returns:
+            Shared asynchronous Ollama client
+        """
+        if cls._shared_client is None:
+            cls._shared_client = ollama.AsyncClient()
+        return cls._shared_client
+    
     async def generate(self, prompt: str, max_tokens: int = 100, 
                       temperature: float = 0.7, response_type: str = "status_summary") -> str:
         """
@@ -44,36 +72,70 @@ class OllamaClient:
         """
         logger.debug(f"Generating {response_type} response using {self.model_name}")
         
+        # Deterministic prompts always produce the same output, so serve repeats from cache
+        cache_key = None
+        if temperature == 0:
+            cache_key = blake2b(
+                f"{self.model_name}\0{max_tokens}\0{prompt}".encode(), digest_size=16
+            ).digest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached {response_type} response")
+                return cached
+        
         try:
-            # Create messages list with user prompt
-            messages = [{"role": "user", "content": prompt}]
-            
-            # Call Ollama API
-            # Using run_in_executor to run the synchronous Ollama API in an async context
-            loop = asyncio.get_event_loop()
             start_time = time.time()
             
-            response = await loop.run_in_executor(
-                None,
-                lambda: ollama.chat(
-                    model=self.model_name,
-                    messages=messages,
-                    options={
-                        "temperature": temperature,
-                        "num_predict": max_tokens
-                    }
-                )
-            )
+            # Collect the streamed chunks into the full response text
+            chunks = [chunk async for chunk in self.stream(prompt, max_tokens, temperature)]
+            response_text = "".join(chunks)
             
             end_time = time.time()
             
-            # Extract the response text
-            response_text = response["message"]["content"]
-            
             logger.debug(f"Response generated in {end_time - start_time:.2f} seconds")
+            
+            if cache_key is not None:
+                self._response_cache[cache_key] = response_text
+                if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                    # Dicts keep insertion order, so the first key is the oldest entry
+                    del self._response_cache[next(iter(self._response_cache))]
+            
             return response_text
             
         except Exception as e:
             logger.error(f"Error generating response with Ollama: {e}")
             # Return a simple error message that doesn't break the application flow
             return f"Error generating response: {str(e)}"
+    
+    async def stream(self, prompt: str, max_tokens: int = 100, 
+                     temperature: float = 0.7) -> AsyncIterator[str]:
+        """
+        Stream a response from Ollama LLM as it is generated.
+        
+        Unlike generate, errors are raised to the caller.
+        
+        Args:
+            prompt: The prompt to send to the model
+            max_tokens: Maximum number of tokens in the response
+            temperature: Temperature parameter for generation
+            
+        Yields:
+            Chunks of the generated response
+        """
+        # Create messages list with user prompt
+        messages = [{"role": "user", "content": prompt}]
+        
+        # Call Ollama API
+        response = await self._client.chat(
+            model=self.model_name,
+            messages=messages,
+            keep_alive=self.keep_alive,
+            stream=True,
+            options={
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        )
+        
+        async for chunk in response:
+            yield chunk["message"]["content"]
@@ -6,10 +6,9 @@ Provides visualizations and interfaces for monitoring elderly users.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import json
 import os
+import zlib
 import time as time_module
 from datetime import datetime, timedelta
 import random
@@ -29,6 +28,10 @@ if "selected_user" not in st.session_state:
 if "active_alerts" not in st.session_state:
     st.session_state.active_alerts = []
 
+# Bumped by the Refresh button to invalidate the cached user list
+if "refresh_token" not in st.session_state:
+    st.session_state.refresh_token = 0
+
 if "system_status" not in st.session_state:
     st.session_state.system_status = {
         "active_users": 0,
@@ -51,15 +54,139 @@ if "system_status" not in st.session_state:
         "uptime": "0h 0m 0s"
     }
 
+# Data loading helpers, cached so reruns don't re-parse the CSV files
+@st.cache_data(ttl=3600)
+def _load_csvs():
+    """
+    Load the safety, health and reminder data files.
+    Cached for an hour so each file is parsed once rather than on every rerun.
+    """
+    # Multithreaded pyarrow parser
+    safety_data = pd.read_csv("data/safety_monitoring.csv", engine="pyarrow")
+    health_data = pd.read_csv("data/health_monitoring.csv", engine="pyarrow")
+    reminder_data = pd.read_csv("data/daily_reminder.csv", engine="pyarrow",
+                                dtype={"Scheduled Time": str})  # "HH:MM:SS" strings, not datetime.time objects
+    
+    # Store the Yes/No flag columns as booleans, so checks and filters are plain mask operations
+    for data in (safety_data, health_data, reminder_data):
+        for column in data.columns[data.columns.str.endswith("(Yes/No)")]:
+            data[column] = data[column].eq("Yes")
+    
+    return safety_data, health_data, reminder_data
+
+@st.cache_data(ttl=3600)
+def _user_ids():
+    """
+    Get the unique user IDs found in any of the data files, in order of first appearance.
+    """
+    safety_data, health_data, reminder_data = _load_csvs()
+    return pd.unique(pd.concat([
+        safety_data["Device-ID/User-ID"],
+        health_data["Device-ID/User-ID"],
+        reminder_data["Device-ID/User-ID"]
+    ], ignore_index=True))
+
+# Health threshold columns mapped to the alert type and message they produce
+HEALTH_ALERT_CHECKS = [
+    ("Heart Rate Below/Above Threshold (Yes/No)", "heart_rate",
+     "Heart rate outside normal range: {heart_rate} bpm"),
+    ("Blood Pressure Below/Above Threshold (Yes/No)", "blood_pressure",
+     "Blood pressure outside normal range: {blood_pressure} mmHg"),
+    ("Glucose Levels Below/Above Threshold (Yes/No)", "glucose",
+     "Glucose level outside normal range: {glucose} mg/dL"),
+    ("SpO₂ Below Threshold (Yes/No)", "oxygen",
+     "Oxygen Saturation (SpO₂%) below threshold: {oxygen}%")
+]
+
+# Reminder columns mapped to the field names used in the reminder lists
+REMINDER_FIELDS = {
+    "Reminder Type": "type",
+    "Scheduled Time": "scheduled_time",
+    "Acknowledged (Yes/No)": "acknowledged"
+}
+
+@st.cache_resource(ttl=3600)
+def _user_groups():
+    """
+    Index the safety, health and reminder records by user ID.
+    Returns a (data, row positions by user ID) pair per file. Built once and shared
+    across reruns, so per-user lookups don't scan the full files.
+    """
+    return tuple(
+        (data, data.groupby("Device-ID/User-ID", sort=False).indices)
+        for data in _load_csvs()
+    )
+
+@st.cache_resource(ttl=3600)
+def _ack_stats():
+    """
+    Count each user's sent and acknowledged reminders.
+    Returns (sent, acknowledged) counts by user ID, computed in one grouped pass
+    over the reminder file rather than per user on every details fetch.
+    """
+    _, _, reminder_data = _load_csvs()
+    sent = reminder_data["Reminder Sent (Yes/No)"]
+    ack = sent & reminder_data["Acknowledged (Yes/No)"]
+    counts = pd.DataFrame({"sent": sent, "ack": ack}).groupby(
+        reminder_data["Device-ID/User-ID"], sort=False
+    ).sum()
+    return dict(zip(counts.index, zip(counts["sent"].tolist(), counts["ack"].tolist())))
+
+@st.cache_data(show_spinner=False)
+def _trend_dates(today):
+    """
+    Get the date index for the 7-day trend charts (the 7 days before today, oldest first).
+    Keyed on today's date, so it is built once per day.
+    """
+    return pd.DatetimeIndex([today - timedelta(days=i) for i in range(7, 0, -1)], name="Date")
+
+def _simulation_rng(user_id, bucket):
+    """
+    Get a random generator seeded from the user and minute bucket.
+    Uses a CRC rather than hash(), which is salted per process, so every
+    session and server process simulates the same values.
+    """
+    return np.random.default_rng(zlib.crc32(f"{user_id}:{bucket}".encode()))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _heart_rate_trend(user_id, bucket):
+    """
+    Generate the simulated 7-day heart rate trend for a user.
+    Keyed on the user and a minute bucket, so reruns within the same minute
+    show the same values.
+    """
+    rng = _simulation_rng(user_id, bucket)
+    return pd.DataFrame(
+        {"BPM": rng.integers(60, 101, size=7)},
+        index=_trend_dates(datetime.now().date())
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _mock_metrics(user_id, bucket):
+    """
+    Generate the simulated safety metrics for a user.
+    Keyed on the user and a minute bucket, so the values stay put between
+    reruns and change with the dashboard's 60 second refresh.
+    """
+    rng = _simulation_rng(user_id, bucket)
+    return {
+        "time_in_location": int(rng.integers(10, 121)),
+        "movement_score": int(rng.integers(60, 96)),
+        "last_room_change": int(rng.integers(5, 61)),
+        "activity_level": str(rng.choice(["Low", "Moderate", "Normal", "High"]))
+    }
+
 # Functions to simulate API calls to the backend
+@st.cache_data(ttl=10)
 def fetch_system_status():
     """
     Fetch system status from backend.
     In this demo, we'll simulate the response.
+    Cached briefly so ordinary reruns don't recompute it.
     """
     # Load data files to get user counts
     try:
-        safety_data = pd.read_csv("data/safety_monitoring.csv")
+        safety_data, _, _ = _load_csvs()
         user_ids = safety_data["Device-ID/User-ID"].unique()
         
         # Generate simulated system status
@@ -111,141 +238,120 @@ def fetch_system_status():
         st.error(f"Error loading data: {e}")
         return st.session_state.system_status
 
-def fetch_user_list():
+@st.cache_data(ttl=30)
+def fetch_user_list(refresh_token=0):
     """
     Fetch list of users from backend.
     In this demo, we'll get the list from data files.
+    Cached so navigation reruns reuse the list; pass a new refresh_token to rebuild it.
     """
     try:
-        # Load data files to get unique user IDs
-        safety_data = pd.read_csv("data/safety_monitoring.csv")
-        health_data = pd.read_csv("data/health_monitoring.csv")
-        reminder_data = pd.read_csv("data/daily_reminder.csv")
-        
-        # Combine user IDs from all data sources
-        user_ids = set(safety_data["Device-ID/User-ID"].unique())
-        user_ids.update(health_data["Device-ID/User-ID"].unique())
-        user_ids.update(reminder_data["Device-ID/User-ID"].unique())
+        # Unique user IDs combined from all data sources
+        user_ids = _user_ids()
         
-        user_list = []
+        # Draw the random demo fields for all users at once
+        n = len(user_ids)
+        statuses = np.random.choice(["normal", "attention", "alert", "emergency", "normal", "normal"], n).tolist()
+        locations = np.random.choice(["Bedroom", "Living Room", "Kitchen", "Bathroom"], n).tolist()
+        activities = np.random.choice(["Sitting", "Walking", "No Movement", "Lying"], n).tolist()
+        minutes_ago = np.random.randint(1, 61, n).tolist()
+        now = datetime.now()
         
-        for user_id in user_ids:
-            # Assign a random status for demo purposes
-            status = random.choice(["normal", "attention", "alert", "emergency", "normal", "normal"])
-            
-            # Create simulated user info
-            user_list.append({
+        # Create simulated user info
+        return [
+            {
                 "user_id": user_id,
                 "name": f"User {user_id}",
                 "status": status,
-                "location": random.choice(["Bedroom", "Living Room", "Kitchen", "Bathroom"]),
-                "activity": random.choice(["Sitting", "Walking", "No Movement", "Lying"]),
-                "last_update": (datetime.now() - timedelta(minutes=random.randint(1, 60))).isoformat()
-            })
-        
-        return user_list
+                "location": location,
+                "activity": activity,
+                "last_update": (now - timedelta(minutes=minutes)).isoformat()
+            }
+            for user_id, status, location, activity, minutes
+            in zip(user_ids, statuses, locations, activities, minutes_ago)
+        ]
     
     except Exception as e:
         st.error(f"Error loading user list: {e}")
         return []
 
+@st.cache_data(ttl=5, show_spinner=False)
 def fetch_user_details(user_id):
     """
     Fetch detailed user information.
     In this demo, we'll generate simulated data.
+    Cached briefly per user, so the repeated calls within and across reruns
+    share one result instead of keeping a copy in session state.
     """
     try:
-        # Load data files to get actual data for this user
-        safety_data = pd.read_csv("data/safety_monitoring.csv")
-        health_data = pd.read_csv("data/health_monitoring.csv")
-        reminder_data = pd.read_csv("data/daily_reminder.csv")
+        # Shared timestamp for every alert generated in this fetch
+        now_iso = datetime.now().isoformat()
         
-        # Filter data for this user
-        user_safety = safety_data[safety_data["Device-ID/User-ID"] == user_id]
-        user_health = health_data[health_data["Device-ID/User-ID"] == user_id]
-        user_reminder = reminder_data[reminder_data["Device-ID/User-ID"] == user_id]
+        # Look up this user's row positions in the pre-built per-user index
+        # (None when the user has no records in that file)
+        (safety_data, safety_rows), (health_data, health_rows), (reminder_data, reminder_rows) = _user_groups()
+        user_safety_rows = safety_rows.get(user_id)
+        user_health_rows = health_rows.get(user_id)
+        user_reminder_rows = reminder_rows.get(user_id)
         
         # Generate health status
         health_status = {}
-        if len(user_health) > 0:
-            latest_health = user_health.iloc[-1]
+        if user_health_rows is not None:
+            # Read the latest record straight from the source frame, no per-user slice
+            latest_health = health_data.iloc[user_health_rows[-1]]
             health_status = {
                 "heart_rate": int(latest_health["Heart Rate"]),
                 "blood_pressure": latest_health["Blood Pressure"],
                 "glucose": int(latest_health["Glucose Levels"]),
                 "oxygen": int(latest_health["Oxygen Saturation (SpO₂%)"]),
                 "alerts": [],
-                "status": "normal" if latest_health["Alert Triggered (Yes/No)"] == "No" else "alert"
+                "status": "alert" if latest_health["Alert Triggered (Yes/No)"] else "normal"
             }
             
             # Add simulated alerts if any triggered
-            if latest_health["Alert Triggered (Yes/No)"] == "Yes":
+            if latest_health["Alert Triggered (Yes/No)"]:
                 # Check which metrics triggered the alert
-                alerts = []
-                if latest_health["Heart Rate Below/Above Threshold (Yes/No)"] == "Yes":
-                    alerts.append({
+                health_status["alerts"] = [
+                    {
                         "level": "warning",
-                        "type": "heart_rate",
-                        "message": f"Heart rate outside normal range: {health_status['heart_rate']} bpm",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                
-                if latest_health["Blood Pressure Below/Above Threshold (Yes/No)"] == "Yes":
-                    alerts.append({
-                        "level": "warning",
-                        "type": "blood_pressure",
-                        "message": f"Blood pressure outside normal range: {health_status['blood_pressure']} mmHg",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                
-                if latest_health["Glucose Levels Below/Above Threshold (Yes/No)"] == "Yes":
-                    alerts.append({
-                        "level": "warning",
-                        "type": "glucose",
-                        "message": f"Glucose level outside normal range: {health_status['glucose']} mg/dL",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                
-                if latest_health["SpO₂ Below Threshold (Yes/No)"] == "Yes":
-                    alerts.append({
-                        "level": "warning",
-                        "type": "oxygen",
-                        "message": f"Oxygen Saturation (SpO₂%) below threshold: {health_status['oxygen']}%",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                
-                health_status["alerts"] = alerts
+                        "type": alert_type,
+                        "message": message.format(**health_status),
+                        "timestamp": now_iso
+                    }
+                    for column, alert_type, message in HEALTH_ALERT_CHECKS
+                    if latest_health[column]
+                ]
         
         # Generate safety status
         safety_status = {}
-        if len(user_safety) > 0:
-            latest_safety = user_safety.iloc[-1]
+        if user_safety_rows is not None:
+            latest_safety = safety_data.iloc[user_safety_rows[-1]]
             safety_status = {
                 "location": latest_safety["Location"],
                 "activity": latest_safety["Movement Activity"],
-                "fall_detected": latest_safety["Fall Detected (Yes/No)"] == "Yes",
+                "fall_detected": bool(latest_safety["Fall Detected (Yes/No)"]),
                 "alerts": [],
                 "status": "normal"
             }
             
             # Add simulated alerts
             alerts = []
-            if latest_safety["Fall Detected (Yes/No)"] == "Yes":
+            if latest_safety["Fall Detected (Yes/No)"]:
                 alerts.append({
                     "level": "urgent",
                     "type": "fall",
                     "message": f"Fall detected in {safety_status['location']}",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 })
                 safety_status["status"] = "emergency"
             
-            elif latest_safety["Alert Triggered (Yes/No)"] == "Yes":
+            elif latest_safety["Alert Triggered (Yes/No)"]:
                 if latest_safety["Movement Activity"] == "No Movement":
                     alerts.append({
                         "level": "warning",
                         "type": "inactivity",
                         "message": f"Extended inactivity detected in {safety_status['location']}",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": now_iso
                     })
                     safety_status["status"] = "attention"
             
@@ -253,39 +359,32 @@ def fetch_user_details(user_id):
         
         # Generate reminder status
         reminder_status = {}
-        if len(user_reminder) > 0:
-            latest_reminder = user_reminder.iloc[-1]
+        if user_reminder_rows is not None:
+            user_reminder = reminder_data.iloc[user_reminder_rows]
+            
+            # Sent mask for the upcoming and recent reminder lists
+            sent = user_reminder["Reminder Sent (Yes/No)"].to_numpy()
             
             # Get upcoming reminders (next 3)
-            upcoming = []
-            for _, row in user_reminder.iterrows():
-                if row["Reminder Sent (Yes/No)"] == "No":
-                    upcoming.append({
-                        "type": row["Reminder Type"],
-                        "scheduled_time": row["Scheduled Time"],
-                        "sent": False,
-                        "acknowledged": False
-                    })
-                    if len(upcoming) >= 3:
-                        break
+            upcoming = (
+                user_reminder.loc[~sent, ["Reminder Type", "Scheduled Time"]]
+                .head(3)
+                .rename(columns=REMINDER_FIELDS)
+                .assign(sent=False, acknowledged=False)
+                .to_dict("records")
+            )
             
             # Get recently sent reminders
-            recent = []
-            for _, row in user_reminder.iterrows():
-                if row["Reminder Sent (Yes/No)"] == "Yes":
-                    recent.append({
-                        "type": row["Reminder Type"],
-                        "scheduled_time": row["Scheduled Time"],
-                        "sent": True,
-                        "acknowledged": row["Acknowledged (Yes/No)"] == "Yes"
-                    })
-                    if len(recent) >= 3:
-                        break
+            recent = (
+                user_reminder.loc[sent, ["Reminder Type", "Scheduled Time", "Acknowledged (Yes/No)"]]
+                .head(3)
+                .rename(columns=REMINDER_FIELDS)
+                .assign(sent=True)
+                .to_dict("records")
+            )
             
-            # Calculate acknowledgment rate
-            sent_count = len(user_reminder[user_reminder["Reminder Sent (Yes/No)"] == "Yes"])
-            ack_count = len(user_reminder[(user_reminder["Reminder Sent (Yes/No)"] == "Yes") & 
-                                          (user_reminder["Acknowledged (Yes/No)"] == "Yes")])
+            # Calculate acknowledgment rate from the precomputed per-user counts
+            sent_count, ack_count = _ack_stats().get(user_id, (0, 0))
             
             ack_rate = (ack_count / sent_count * 100) if sent_count > 0 else 0
             
@@ -303,7 +402,7 @@ def fetch_user_details(user_id):
                     "level": "warning",
                     "type": "low_acknowledgment",
                     "message": f"Low reminder acknowledgment rate: {ack_rate:.1f}%",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 })
         
         # Combine all alerts
@@ -375,9 +474,7 @@ def update_data():
     
     # Update selected user if one is selected
     if st.session_state.selected_user:
-        user_details = fetch_user_details(st.session_state.selected_user)
-        st.session_state.user_details = user_details
-        st.session_state.active_alerts = user_details.get("alerts", [])
+        st.session_state.active_alerts = fetch_user_details(st.session_state.selected_user).get("alerts", [])
 
 def handle_user_selection():
     """
@@ -386,28 +483,49 @@ def handle_user_selection():
     # Get the selected user ID from the session state
     selected_user_id = st.session_state.selected_user
     
-    # Fetch fresh user details for the selected user
-    user_details = fetch_user_details(selected_user_id)
-    
-    # Update session state with the new details
-    st.session_state.user_details = user_details
-    st.session_state.active_alerts = user_details.get("alerts", [])
+    # Track the selected user's alerts (the details themselves are read from the cache)
+    st.session_state.active_alerts = fetch_user_details(selected_user_id).get("alerts", [])
 
 def resolve_alert(alert):
     """
     Resolve an alert (simulated).
+    Used as the resolve buttons' on_click callback, so it runs before the rerun renders.
     """
     # In a real application, this would call an API endpoint
     if alert in st.session_state.active_alerts:
         st.session_state.active_alerts.remove(alert)
         
-        # Show success message
-        st.success(f"Alert resolved: {alert.get('message', 'No message')}")
+        # Show success message (a toast, since callback output isn't placed in the layout)
+        st.toast(f"Alert resolved: {alert.get('message', 'No message')}")
         
         # Refresh data
-        time_module.sleep(0.5)  # Simulate API call delay
         update_data()
 
+def _status_pie_spec(labels, sizes, colors):
+    """
+    Build a Vega-Lite spec for the status distribution pie chart.
+    Drawn in the browser, so no figure is rendered or rasterized on the server.
+    """
+    return {
+        "data": {"values": [{"status": label, "count": size} for label, size in zip(labels, sizes)]},
+        "mark": {"type": "arc", "stroke": "white", "strokeWidth": 2},
+        "encoding": {
+            "theta": {"field": "count", "type": "quantitative"},
+            "color": {
+                "field": "status",
+                "type": "nominal",
+                "sort": labels,
+                "scale": {"domain": labels, "range": colors},
+                "legend": {"title": "Status Categories", "orient": "right"}
+            },
+            "tooltip": [
+                {"field": "status", "type": "nominal", "title": "Status"},
+                {"field": "count", "type": "quantitative", "title": "Users"}
+            ]
+        },
+        "view": {"stroke": None}
+    }
+
 # Define color scheme for status levels
 status_colors = {
     "normal": "green",
@@ -417,32 +535,64 @@ status_colors = {
     "unknown": "gray"
 }
 
-# Main dashboard
-st.title("CareCompanion Dashboard")
-st.markdown("### Elderly Care Monitoring System")
+# Emoji shown next to a user's name for each status level
+status_emojis = {
+    "normal": "🟢",
+    "attention": "🟠",
+    "alert": "🔴",
+    "emergency": "⚠️",
+    "unknown": "⚪"
+}
 
-# Refresh button
-if st.button("Refresh Data", key="refresh_button"):
-    update_data()
-    
-    # If there's a currently selected user, update their data too
-    if st.session_state.selected_user:
-        user_details = fetch_user_details(st.session_state.selected_user)
-        st.session_state.user_details = user_details
-        st.session_state.active_alerts = user_details.get("alerts", [])
-    
-    st.success("Data refreshed successfully!")
+# Icon for each reminder type (anything else gets an alarm clock)
+reminder_type_icons = {
+    "Medication": "💊",
+    "Hydration": "💧",
+    "Appointment": "📅",
+    "Exercise": "🏃"
+}
 
-# Create two columns for the layout
-col1, col2 = st.columns([1, 3])
+# Text color for each alert level (anything else is shown in red)
+alert_colors = {
+    "info": "blue",
+    "warning": "orange",
+    "urgent": "red"
+}
 
-# Sidebar with user list
-with col1:
-    st.subheader("System Status")
-    
-    # Display system metrics
+def render_alert_list(alerts, section, user_id, button_prefix="", card_label="Type"):
+    """
+    Render a list of alerts as bordered cards, each with its resolve button.
+    Uses native Streamlit elements rather than raw HTML, so no unsafe_allow_html parsing.
+    """
+    for idx, alert in enumerate(alerts):
+        level = alert.get("level", "info")
+        message = alert.get("message", "No message")
+        alert_type = alert.get("type", "unknown")
+        
+        with st.container(border=True):
+            st.markdown(f"**:{alert_colors.get(level, 'red')}[{level.upper()}: {message}]**")
+            st.caption(f"{card_label}: {alert_type}")
+            
+            st.button(
+                f"Resolve {button_prefix}{alert_type.title()} Alert",
+                key=f"resolve_{section}_{user_id}_{alert.get('id', idx)}",
+                on_click=resolve_alert,
+                args=(alert,)
+            )
+
+@st.fragment(run_every=60)
+def render_system_status():
+    """
+    Render the system metrics, agent status and status distribution chart.
+    Runs as a fragment that reruns on its own every 60 seconds to refresh the data,
+    without re-executing the rest of the page.
+    """
+    # Refresh session data (cheap on ordinary reruns, the fetches are cached)
+    update_data()
     system_status = st.session_state.system_status
     
+    st.subheader("System Status")
+    
     # Create metrics row
     metric1, metric2, metric3 = st.columns(3)
     
@@ -467,150 +617,38 @@ with col1:
     st.subheader("User Status Distribution")
     status_counts = system_status["user_status_counts"]
 
-    # Prepare data for chart
-    labels = list(status_counts.keys())
-    sizes = list(status_counts.values())
-
-    # Filter out NaN values and zeros
-    valid_indices = []
-    for i, size in enumerate(sizes):
-        if not (pd.isna(size) or size == 0):
-            valid_indices.append(i)
-
-    filtered_labels = [labels[i] for i in valid_indices]
-    filtered_sizes = [sizes[i] for i in valid_indices]
+    # Filter out empty statuses (counts are always plain ints)
+    filtered_labels = [label for label, size in status_counts.items() if size]
+    filtered_sizes = [status_counts[label] for label in filtered_labels]
     filtered_colors = [status_colors[status] for status in filtered_labels]
 
     # Only create pie chart if we have valid data
     if filtered_sizes:
-        # Create a larger figure with more space
-        fig, ax = plt.subplots(figsize=(6, 4))
-        
-        # Add slight explode effect to all slices
-        explode = [0.05] * len(filtered_sizes)
-        
-        # Draw pie chart with no percentages
-        wedges, _ = ax.pie(
-            filtered_sizes, 
-            labels=None,  # No direct labels
-            colors=filtered_colors, 
-            autopct=None,  # Remove percentage labels
-            startangle=90,
-            explode=explode
-        )
-        
-        # Add a legend to the right side
-        ax.legend(
-            wedges,
-            filtered_labels,
-            title="Status Categories",
-            loc="center left",
-            bbox_to_anchor=(1, 0, 0.5, 1)
-        )
-        
-        ax.axis('equal')
-        plt.tight_layout()
-        
-        # Display in Streamlit
-        st.pyplot(fig)
+        st.vega_lite_chart(_status_pie_spec(filtered_labels, filtered_sizes, filtered_colors),
+                           use_container_width=True)
     else:
         st.warning("No valid status data available")
     
     # Uptime information
     st.markdown(f"**System Uptime**: {system_status['uptime']}")
-    
-    # User list
-    st.subheader("User List")
-
-    # Create selectbox for user selection
-    user_list = fetch_user_list()
-
-    # Create a unique key for the selectbox to prevent state issues
-    selectbox_key = "user_selector_" + str(hash(str(user_list)))
-
-    # Count users by status for the summary
-    status_counts = {}
-    for user in user_list:
-        status = user["status"]
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    # Format options for dropdown
-    user_options = [f"{user['name']} ({user['status']})" for user in user_list]
-    user_dict = {f"{user['name']} ({user['status']})": user["user_id"] for user in user_list}
-
-    # Create a callback function specifically for the selectbox
-    def on_user_select():
-        option = st.session_state[selectbox_key]
-        if option and option in user_dict:
-            st.session_state.selected_user = user_dict[option]
-
-    # Find the current selection, if any
-    current_selection = None
-    if hasattr(st.session_state, 'selected_user') and st.session_state.selected_user:
-        # Find the label for the current selection
-        for label, user_id in user_dict.items():
-            if user_id == st.session_state.selected_user:
-                current_selection = label
-                break
-
-    # Create the selectbox
-    selected_option = st.selectbox(
-        "Select a user to view details:",
-        options=user_options,
-        index=user_options.index(current_selection) if current_selection in user_options else 0,
-        key=selectbox_key,
-        on_change=on_user_select
-    )
-
-    # If no selection has been made yet, initialize with the first user
-    if not hasattr(st.session_state, 'selected_user') or not st.session_state.selected_user:
-        st.session_state.selected_user = user_dict[selected_option]
-        # We'll handle the user details in the main content area
-
-    # After the selectbox, add this code to call handle_user_selection
-    if st.session_state.selected_user:
-        # We only need to call this if the user details aren't already loaded
-        if "user_details" not in st.session_state or st.session_state.user_details.get("user_id") != st.session_state.selected_user:
-            handle_user_selection()
 
-    # Display the selected user's details
-    if st.session_state.selected_user:
-        selected_user_id = st.session_state.selected_user
-        selected_user = next((user for user in user_list if user["user_id"] == selected_user_id), None)
-        
-        if selected_user:
-            status_color = status_colors.get(selected_user["status"], "gray")
-            status_emoji = "🟢" if selected_user["status"] == "normal" else "🟠" if selected_user["status"] == "attention" else "🔴" if selected_user["status"] == "alert" else "⚠️" if selected_user["status"] == "emergency" else "⚪"
-            
-            st.markdown(
-                f"""
-                <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; border-left: 5px solid {status_color}; background-color: #f0f2f6;">
-                    <div style="font-weight: bold;">{status_emoji} {selected_user["name"]}</div>
-                    <div style="font-size: 0.8em;">Location: {selected_user["location"]}</div>
-                    <div style="font-size: 0.8em;">Activity: {selected_user["activity"]}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-
-    # Add a small summary of user statistics
-    st.markdown("#### User Statistics")
-    st.write(f"Total Users: {len(user_list)}")
-    for status, count in status_counts.items():
-        status_color = status_colors.get(status, "gray")
-        st.markdown(f"<span style='color: {status_color};'>{status.title()}</span>: {count}", unsafe_allow_html=True)
-
-# Main content area
-with col2:
+@st.fragment(run_every=60)
+def render_user_panel():
+    """
+    Render the selected user's details and alerts.
+    Runs as a fragment, so switching sections or resolving alerts only reruns this panel,
+    and it reruns on its own every 60 seconds so the alert lists stay current.
+    """
     # User details section
     if st.session_state.selected_user:
-        # Fetch user details if not already in session state
-        if "user_details" not in st.session_state:
-            user_details = fetch_user_details(st.session_state.selected_user)
-            st.session_state.user_details = user_details
-            st.session_state.active_alerts = user_details.get("alerts", [])
-        else:
-            user_details = st.session_state.user_details
+        # Cached per user, so this doesn't recompute what update_data just fetched
+        user_details = fetch_user_details(st.session_state.selected_user)
+        
+        # Keep the alerts the resolve buttons act on in step with the ones shown
+        st.session_state.active_alerts = user_details.get("alerts", [])
+        
+        # Resolve button keys include the user so widget state never carries over between users
+        current_user_id = st.session_state.selected_user
         
         # User header with status
         user_name = user_details.get("name", f"User {st.session_state.selected_user}")
@@ -633,10 +671,18 @@ with col2:
         st.markdown(f"**Summary**: {user_details.get('summary', 'No summary available')}")
         
         # Create tabs for different categories - removed "Social" tab
-        tabs = st.tabs(["Overview", "Health", "Safety", "Reminders", "Alerts"])
+        # A horizontal radio exposes the selection, so only the active tab's body runs
+        # (st.tabs executes every tab body on each rerun)
+        active_tab = st.radio(
+            "Section",
+            ["Overview", "Health", "Safety", "Reminders", "Alerts"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="active_tab"
+        )
         
         # Overview tab
-        with tabs[0]:
+        if active_tab == "Overview":
             st.subheader("Current Status")
             
             # Create metrics row - reduced to 3 columns
@@ -670,31 +716,12 @@ with col2:
             active_alerts = user_details.get("alerts", [])
             
             if active_alerts:
-                for alert in active_alerts:
-                    level = alert.get("level", "info")
-                    message = alert.get("message", "No message")
-                    source = alert.get("type", "unknown")
-                    
-                    alert_color = "blue" if level == "info" else "orange" if level == "warning" else "red"
-                    
-                    st.markdown(
-                        f"""
-                        <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba({', '.join(['255, 0, 0, 0.1'] if level == 'urgent' else ['255, 165, 0, 0.1'] if level == 'warning' else ['0, 0, 255, 0.1'])});">
-                            <div style="font-weight: bold; color: {alert_color};">{level.upper()}: {message}</div>
-                            <div style="font-size: 0.8em;">Source: {source}</div>
-                        </div>
-                        """,
-                        unsafe_allow_html=True
-                    )
-                    
-                    # Add a resolve button (since we can't use the HTML button)
-                    if st.button(f"Resolve {source.title()} Alert", key=f"resolve_{source}_{alert.get('timestamp', '')}"):
-                        resolve_alert(alert)
+                render_alert_list(active_alerts, "overview", current_user_id, card_label="Source")
             else:
                 st.info("No active alerts")
         
         # Health tab
-        with tabs[1]:
+        elif active_tab == "Health":
             health_data = user_details.get("health", {})
             
             if health_data:
@@ -724,52 +751,28 @@ with col2:
                 # Mock health trend visualization
                 st.subheader("Health Trends (Last 7 Days)")
                 
-                # Generate random data for demo
-                dates = [datetime.now() - timedelta(days=i) for i in range(7, 0, -1)]
-                date_labels = [date.strftime("%m/%d") for date in dates]
+                # Heart rate trend (simulated, stable for a minute at a time)
+                heart_rate_trend = _heart_rate_trend(
+                    st.session_state.selected_user, int(time_module.time() // 60)
+                )
                 
-                # Heart rate trend (simulated)
-                heart_rates = [random.randint(60, 100) for _ in range(7)]
-                
-                # Create figure
-                fig, ax = plt.subplots(figsize=(10, 4))
-                ax.plot(date_labels, heart_rates, marker='o', linestyle='-', color='red')
-                ax.set_title('Heart Rate Trend')
-                ax.set_ylabel('BPM')
-                ax.grid(True, linestyle='--', alpha=0.7)
-                st.pyplot(fig)
+                # Vega-Lite chart rendered in the browser, no matplotlib figure per rerun
+                st.markdown("**Heart Rate Trend**")
+                st.line_chart(heart_rate_trend, y_label="BPM", color="#ff0000")
                 
                 # Health alerts
                 st.subheader("Health Alerts")
                 health_alerts = health_data.get("alerts", [])
                 
                 if health_alerts:
-                    for alert in health_alerts:
-                        level = alert.get("level", "info")
-                        message = alert.get("message", "No message")
-                        alert_type = alert.get("type", "unknown")
-                        
-                        alert_color = "blue" if level == "info" else "orange" if level == "warning" else "red"
-                        
-                        st.markdown(
-                            f"""
-                            <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba({', '.join(['255, 0, 0, 0.1'] if level == 'urgent' else ['255, 165, 0, 0.1'] if level == 'warning' else ['0, 0, 255, 0.1'])});">
-                                <div style="font-weight: bold; color: {alert_color};">{level.upper()}: {message}</div>
-                                <div style="font-size: 0.8em;">Type: {alert_type}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                        
-                        if st.button(f"Resolve {alert_type.title()} Alert", key=f"resolve_health_{alert_type}"):
-                            resolve_alert(alert)
+                    render_alert_list(health_alerts, "health", current_user_id)
                 else:
                     st.info("No active health alerts")
             else:
                 st.warning("No health data available")
         
         # Safety tab
-        with tabs[2]:
+        elif active_tab == "Safety":
             safety_data = user_details.get("safety", {})
             
             if safety_data:
@@ -803,47 +806,30 @@ with col2:
                 st.subheader("Safety Information")
                 
                 # Add some basic safety metrics instead of the home layout
+                mock_metrics = _mock_metrics(st.session_state.selected_user, int(time_module.time() // 60))
                 metrics_col1, metrics_col2 = st.columns(2)
                 
                 with metrics_col1:
-                    st.metric("Time in Current Location", f"{random.randint(10, 120)} minutes")
-                    st.metric("Daily Movement Score", f"{random.randint(60, 95)}%")
+                    st.metric("Time in Current Location", f"{mock_metrics['time_in_location']} minutes")
+                    st.metric("Daily Movement Score", f"{mock_metrics['movement_score']}%")
                 
                 with metrics_col2:
-                    st.metric("Last Room Change", f"{random.randint(5, 60)} minutes ago")
-                    st.metric("Activity Level", f"{random.choice(['Low', 'Moderate', 'Normal', 'High'])}")
+                    st.metric("Last Room Change", f"{mock_metrics['last_room_change']} minutes ago")
+                    st.metric("Activity Level", mock_metrics["activity_level"])
                 
                 # Safety alerts
                 st.subheader("Safety Alerts")
                 safety_alerts = safety_data.get("alerts", [])
                 
                 if safety_alerts:
-                    for alert in safety_alerts:
-                        level = alert.get("level", "info")
-                        message = alert.get("message", "No message")
-                        alert_type = alert.get("type", "unknown")
-                        
-                        alert_color = "blue" if level == "info" else "orange" if level == "warning" else "red"
-                        
-                        st.markdown(
-                            f"""
-                            <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba({', '.join(['255, 0, 0, 0.1'] if level == 'urgent' else ['255, 165, 0, 0.1'] if level == 'warning' else ['0, 0, 255, 0.1'])});">
-                                <div style="font-weight: bold; color: {alert_color};">{level.upper()}: {message}</div>
-                                <div style="font-size: 0.8em;">Type: {alert_type}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                        
-                        if st.button(f"Resolve {alert_type.title()} Alert", key=f"resolve_safety_{alert_type}"):
-                            resolve_alert(alert)
+                    render_alert_list(safety_alerts, "safety", current_user_id)
                 else:
                     st.info("No active safety alerts")
             else:
                 st.warning("No safety data available")
         
         # Reminders tab
-        with tabs[3]:
+        elif active_tab == "Reminders":
             reminder_data = user_details.get("reminders", {})
             
             if reminder_data:
@@ -868,7 +854,7 @@ with col2:
                         reminder_type = reminder.get("type", "Unknown")
                         time = reminder.get("scheduled_time", "Unknown")
                         
-                        type_icon = "💊" if reminder_type == "Medication" else "💧" if reminder_type == "Hydration" else "📅" if reminder_type == "Appointment" else "🏃" if reminder_type == "Exercise" else "⏰"
+                        type_icon = reminder_type_icons.get(reminder_type, "⏰")
                         
                         st.markdown(
                             f"""
@@ -892,7 +878,7 @@ with col2:
                         time = reminder.get("scheduled_time", "Unknown")
                         acknowledged = reminder.get("acknowledged", False)
                         
-                        type_icon = "💊" if reminder_type == "Medication" else "💧" if reminder_type == "Hydration" else "📅" if reminder_type == "Appointment" else "🏃" if reminder_type == "Exercise" else "⏰"
+                        type_icon = reminder_type_icons.get(reminder_type, "⏰")
                         status_icon = "✅" if acknowledged else "⏳"
                         
                         st.markdown(
@@ -913,124 +899,156 @@ with col2:
                 reminder_alerts = reminder_data.get("alerts", [])
                 
                 if reminder_alerts:
-                    for alert in reminder_alerts:
-                        level = alert.get("level", "info")
-                        message = alert.get("message", "No message")
-                        alert_type = alert.get("type", "unknown")
-                        
-                        alert_color = "blue" if level == "info" else "orange" if level == "warning" else "red"
-                        
-                        st.markdown(
-                            f"""
-                            <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba({', '.join(['255, 0, 0, 0.1'] if level == 'urgent' else ['255, 165, 0, 0.1'] if level == 'warning' else ['0, 0, 255, 0.1'])});">
-                                <div style="font-weight: bold; color: {alert_color};">{level.upper()}: {message}</div>
-                                <div style="font-size: 0.8em;">Type: {alert_type}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                        
-                        if st.button(f"Resolve {alert_type.title()} Alert", key=f"resolve_reminder_{alert_type}"):
-                            resolve_alert(alert)
+                    render_alert_list(reminder_alerts, "reminder", current_user_id)
                 else:
                     st.info("No active reminder alerts")
             else:
                 st.warning("No reminder data available")
         
         # Alerts tab
-        with tabs[4]:
+        elif active_tab == "Alerts":
             st.subheader("All Active Alerts")
             
             alerts = user_details.get("alerts", [])
             
             if alerts:
-                # Group alerts by level
-                urgent_alerts = [a for a in alerts if a.get("level") == "urgent"]
-                warning_alerts = [a for a in alerts if a.get("level") == "warning"]
-                info_alerts = [a for a in alerts if a.get("level") == "info"]
-                
-                # Display urgent alerts first
-                if urgent_alerts:
-                    st.markdown("#### Urgent Alerts")
-                    for alert in urgent_alerts:
-                        message = alert.get("message", "No message")
-                        alert_type = alert.get("type", "unknown")
-                        
-                        st.markdown(
-                            f"""
-                            <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba(255, 0, 0, 0.1);">
-                                <div style="font-weight: bold; color: red;">URGENT: {message}</div>
-                                <div style="font-size: 0.8em;">Type: {alert_type}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                        
-                        if st.button(f"Resolve Urgent {alert_type.title()} Alert", key=f"resolve_urgent_{alert_type}"):
-                            resolve_alert(alert)
-                
-                # Display warning alerts
-                if warning_alerts:
-                    st.markdown("#### Warning Alerts")
-                    for alert in warning_alerts:
-                        message = alert.get("message", "No message")
-                        alert_type = alert.get("type", "unknown")
-                        
-                        st.markdown(
-                            f"""
-                            <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba(255, 165, 0, 0.1);">
-                                <div style="font-weight: bold; color: orange;">WARNING: {message}</div>
-                                <div style="font-size: 0.8em;">Type: {alert_type}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                        
-                        if st.button(f"Resolve Warning {alert_type.title()} Alert", key=f"resolve_warning_{alert_type}"):
-                            resolve_alert(alert)
-                
-                # Display info alerts
-                if info_alerts:
-                    st.markdown("#### Information Alerts")
-                    for alert in info_alerts:
-                        message = alert.get("message", "No message")
-                        alert_type = alert.get("type", "unknown")
-                        
-                        st.markdown(
-                            f"""
-                            <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; background-color: rgba(0, 0, 255, 0.1);">
-                                <div style="font-weight: bold; color: blue;">INFO: {message}</div>
-                                <div style="font-size: 0.8em;">Type: {alert_type}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                        
-                        if st.button(f"Resolve Info {alert_type.title()} Alert", key=f"resolve_info_{alert_type}"):
-                            resolve_alert(alert)
+                # Group alerts by level in a single pass (other levels aren't listed)
+                alerts_by_level = {"urgent": [], "warning": [], "info": []}
+                for alert in alerts:
+                    bucket = alerts_by_level.get(alert.get("level"))
+                    if bucket is not None:
+                        bucket.append(alert)
+                # Display each non-empty level, urgent first
+                for level, heading, label in (
+                    ("urgent", "Urgent Alerts", "Urgent"),
+                    ("warning", "Warning Alerts", "Warning"),
+                    ("info", "Information Alerts", "Info")
+                ):
+                    level_alerts = alerts_by_level[level]
+                    if not level_alerts:
+                        continue
+                    
+                    st.markdown(f"#### {heading}")
+                    render_alert_list(level_alerts, level, current_user_id, button_prefix=f"{label} ")
                 
                 # Add resolve all button
                 if st.button("Resolve All Alerts"):
                     st.session_state.active_alerts = []
-                    st.success("All alerts resolved")
-                    time_module.sleep(0.5)  # Simulate API call delay
                     update_data()
+                    
+                    # The tab above was drawn before the click was handled, so rerun the panel to show
+                    # the new state; a toast survives the rerun where st.success would be cleared
+                    st.toast("All alerts resolved")
+                    st.rerun(scope="fragment")
             else:
                 st.info("No active alerts")
     else:
         st.info("Select a user from the list to view details")
 
-# Initialize data on first run
-if "initialized" not in st.session_state:
-    update_data()
-    st.session_state.initialized = True
+# Main dashboard
+st.title("CareCompanion Dashboard")
+st.markdown("### Elderly Care Monitoring System")
 
-# Periodically refresh data (every 60 seconds)
-if "last_refresh" not in st.session_state:
-    st.session_state.last_refresh = time_module.time()
-elif time_module.time() - st.session_state.last_refresh > 60:
-    update_data()
-    st.session_state.last_refresh = time_module.time()
+# Refresh button
+if st.button("Refresh Data", key="refresh_button"):
+    st.session_state.refresh_token += 1
+    
+    # Drop cached results so the refresh fetches fresh data
+    fetch_system_status.clear()
+    fetch_user_details.clear()
+    
+    # render_system_status calls update_data later in this rerun, so there's no need to here
+    st.success("Data refreshed successfully!")
+
+# Create two columns for the layout
+col1, col2 = st.columns([1, 3])
+
+# Sidebar with user list
+with col1:
+    # Display system metrics
+    render_system_status()
+    
+    # User list
+    st.subheader("User List")
+
+    # Create selectbox for user selection. The list is kept in session state until the
+    # next Refresh, so its simulated statuses don't change when the shared cache expires.
+    if st.session_state.get("user_list_token") != st.session_state.refresh_token:
+        st.session_state.user_list = fetch_user_list(st.session_state.refresh_token)
+        st.session_state.user_list_token = st.session_state.refresh_token
+    user_list = st.session_state.user_list
+    users_by_id = {user["user_id"]: user for user in user_list}
+
+    # Widget state is already scoped to the session, so a fixed key is enough
+    selectbox_key = "user_selector"
+
+    # Count users by status for the summary
+    statuses, counts = np.unique([user["status"] for user in user_list], return_counts=True)
+    status_counts = dict(zip(statuses.tolist(), counts.tolist()))
+
+    # Format options for dropdown
+    user_dict = {f"{user['name']} ({user['status']})": user["user_id"] for user in user_list}
+    user_options = list(user_dict)
+
+    # Create a callback function specifically for the selectbox
+    def on_user_select():
+        option = st.session_state[selectbox_key]
+        if option and option in user_dict:
+            st.session_state.selected_user = user_dict[option]
+            handle_user_selection()
+
+    # Find the current selection, if any
+    current_selection = None
+    if hasattr(st.session_state, 'selected_user') and st.session_state.selected_user:
+        # Find the label for the current selection
+        current_user = users_by_id.get(st.session_state.selected_user)
+        if current_user:
+            current_selection = f"{current_user['name']} ({current_user['status']})"
+
+    # Create the selectbox
+    selected_option = st.selectbox(
+        "Select a user to view details:",
+        options=user_options,
+        index=user_options.index(current_selection) if current_selection in user_options else 0,
+        key=selectbox_key,
+        on_change=on_user_select
+    )
+
+    # If no selection has been made yet, initialize with the first user
+    if not hasattr(st.session_state, 'selected_user') or not st.session_state.selected_user:
+        st.session_state.selected_user = user_dict[selected_option]
+        handle_user_selection()
+
+    # Display the selected user's details
+    if st.session_state.selected_user:
+        selected_user_id = st.session_state.selected_user
+        selected_user = users_by_id.get(selected_user_id)
+        
+        if selected_user:
+            status_color = status_colors.get(selected_user["status"], "gray")
+            status_emoji = status_emojis.get(selected_user["status"], "⚪")
+            
+            st.markdown(
+                f"""
+                <div style="padding: 10px; margin-bottom: 10px; border-radius: 5px; border-left: 5px solid {status_color}; background-color: #f0f2f6;">
+                    <div style="font-weight: bold;">{status_emoji} {selected_user["name"]}</div>
+                    <div style="font-size: 0.8em;">Location: {selected_user["location"]}</div>
+                    <div style="font-size: 0.8em;">Activity: {selected_user["activity"]}</div>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+    # Add a small summary of user statistics
+    st.markdown("#### User Statistics")
+    st.write(f"Total Users: {len(user_list)}")
+    for status, count in status_counts.items():
+        status_color = status_colors.get(status, "gray")
+        st.markdown(f"<span style='color: {status_color};'>{status.title()}</span>: {count}", unsafe_allow_html=True)
+
+# Main content area
+with col2:
+    render_user_panel()
 
 # Footer
 st.markdown("---")